@@ -1,32 +1,56 @@
 #!/usr/bin/env python3
 """Flask web app for JD-Résumé Gap Analyzer - port of React app."""
 
+import io
 import json
 import os
+import shutil
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote
 
+import orjson
 from flask import Flask, render_template, request, jsonify, send_file
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
+from flask_compress import Compress
 
-from gap_analyzer.pdf_parser import extract_text_from_pdf
-from gap_analyzer.web_service import (
-    MODEL,
-    analyze_jd,
-    analyze_resume,
-    tailor_resume,
-    refine_resume,
-    perform_gap_analysis,
-)
-from gap_analyzer.frozen_pipeline import run_frozen_analysis
-from gap_analyzer.tailored_pdf import generate_tailored_pdf
+from gap_analyzer.pdf_parser import extract_text_from_pdf, extract_text_in_pool
 from gap_analyzer.audit import audit_log, log_model_performance, setup_app_logging
+from src.utils import atomic_open, clone_json, hash_text
 
 load_dotenv()
 
 log = setup_app_logging()
 
+
+class OrjsonProvider(JSONProvider):
+    """jsonify/get_json backed by orjson; the /api/analyze payload runs to hundreds of KB."""
+
+    sort_keys = True
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self._dump_bytes(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dump_bytes(obj), mimetype="application/json")
+
+    def _dump_bytes(self, obj) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16MB
+# /api/analyze returns 50-200KB of natural-language JSON; gzip it on the wire.
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_LEVEL"] = 6
+Compress(app)
 
 SAMPLE_JD = """We are looking for a Senior Python Engineer to lead our backend team.
 Requirements:
@@ -64,7 +88,6 @@ def api_requirements_build():
         return jsonify({"error": "GROQ_API_KEY is not set. Add it to .env in the project root."}), 400
 
     try:
-        from src.utils import hash_text
         from src.pipeline.extract import extract_requirements_from_jd, MODEL_ID as EXTRACT_MODEL
         from src.pipeline.artifacts import save_requirements_artifact, load_requirements_artifact_by_jd_hash
 
@@ -74,7 +97,7 @@ def api_requirements_build():
             extract_model = EXTRACT_MODEL  # cached artifact; current extract model for audit
             log.info("Requirements artifact already exists for jd_hash=%s, skipping extraction", jd_hash[:16])
         except FileNotFoundError:
-            requirements_doc = extract_requirements_from_jd(api_key, jd_text)
+            requirements_doc = extract_requirements_from_jd(api_key, jd_text, jd_hash=jd_hash)
             extract_model = requirements_doc.get("_audit", {}).get("model_id", EXTRACT_MODEL)
             # Strip _audit before saving (audit metadata not part of canonical artifact)
             to_save = {k: v for k, v in requirements_doc.items() if k != "_audit"}
@@ -115,6 +138,66 @@ def api_requirements_build():
         return jsonify({"error": str(e)}), 500
 
 
+# Fields of the analysis result returned by /api/analyze and recorded in its audit entry.
+_ANALYZE_RESPONSE_KEYS = (
+    "jd_analysis",
+    "resume_analysis",
+    "gap_report",
+    "match_score",
+    "jd_hash",
+    "resume_hash",
+    "requirements_version",
+    "requirements_source",
+    "requirements_artifact_path",
+    "num_requirements",
+    "must_have_coverage",
+    "nice_to_have_coverage",
+)
+_ANALYZE_AUDIT_KEYS = (
+    "jd_hash",
+    "resume_hash",
+    "requirements_version",
+    "requirements_source",
+    "requirements_artifact_path",
+    "requirements_hash",
+    "num_requirements",
+    "matched_count_raw",
+    "matched_count_validated",
+    "invalid_quote_count",
+    "evidence_prompt_includes_description",
+    "prompt_version",
+    "prompt_hash",
+    "model_params",
+)
+
+
+def _web_model() -> str:
+    """web_service.MODEL for audit logging; imported on first use so startup does not load groq."""
+    from gap_analyzer.web_service import MODEL
+
+    return MODEL
+
+
+@lru_cache(maxsize=1)
+def _mock_analysis() -> tuple[dict, dict, list[dict], int]:
+    """
+    Mock mode ignores the input texts (analyze_jd/analyze_resume return the mock constants), so
+    the analysis is computed once.
+    """
+    from gap_analyzer.web_service import analyze_jd, analyze_resume, perform_gap_analysis
+
+    jd_result = analyze_jd("", "", True)
+    resume_result = analyze_resume("", "", True)
+    gap_report, match_score = perform_gap_analysis(jd_result, resume_result)
+    return jd_result, resume_result, gap_report, match_score
+
+
+def _mock_analyze() -> tuple[dict, dict, list[dict], int]:
+    """Copy of the memoized mock analysis, so one request cannot alter what later ones get."""
+    jd_result, resume_result, gap_report, match_score = _mock_analysis()
+    return clone_json(jd_result), clone_json(resume_result), clone_json(gap_report), match_score
+
+
 @app.route("/api/analyze", methods=["POST"])
 def api_analyze():
     """Run JD + Resume analysis and gap report."""
@@ -133,9 +216,7 @@ def api_analyze():
 
     try:
         if use_mock:
-            jd_result = analyze_jd(api_key, jd_text, use_mock)
-            resume_result = analyze_resume(api_key, resume_text, use_mock)
-            gap_report, match_score = perform_gap_analysis(jd_result, resume_result)
+            jd_result, resume_result, gap_report, match_score = _mock_analyze()
             result = {
                 "jd_analysis": jd_result,
                 "resume_analysis": resume_result,
@@ -151,12 +232,14 @@ def api_analyze():
                 "nice_to_have_coverage": None,
             }
         else:
+            from gap_analyzer.frozen_pipeline import run_frozen_analysis
+
             result = run_frozen_analysis(api_key, jd_text, resume_text)
             if result.get("requirements_source") != "artifact":
                 raise RuntimeError("requirements_source must be 'artifact'; internal error")
 
         # Log actual model used (match stage); fallback to env for backward compat
-        model_name = result.get("model_id") or MODEL if not use_mock else "mock"
+        model_name = result.get("model_id") or _web_model() if not use_mock else "mock"
         audit_log(
             action="analyze",
             status="success",
@@ -168,20 +251,7 @@ def api_analyze():
             extra={
                 "role_title": result["jd_analysis"].get("role_title"),
                 "candidate_name": result["resume_analysis"].get("candidate_name"),
-                "jd_hash": result.get("jd_hash"),
-                "resume_hash": result.get("resume_hash"),
-                "requirements_version": result.get("requirements_version"),
-                "requirements_source": result.get("requirements_source"),
-                "requirements_artifact_path": result.get("requirements_artifact_path"),
-                "requirements_hash": result.get("requirements_hash"),
-                "num_requirements": result.get("num_requirements"),
-                "matched_count_raw": result.get("matched_count_raw"),
-                "matched_count_validated": result.get("matched_count_validated"),
-                "invalid_quote_count": result.get("invalid_quote_count"),
-                "evidence_prompt_includes_description": result.get("evidence_prompt_includes_description"),
-                "prompt_version": result.get("prompt_version"),
-                "prompt_hash": result.get("prompt_hash"),
-                "model_params": result.get("model_params"),
+                **{k: result.get(k) for k in _ANALYZE_AUDIT_KEYS},
             },
         )
         log_model_performance(
@@ -212,20 +282,7 @@ def api_analyze():
         )
         log.info("Analyze complete: match_score=%d%% requirements_source=%s", result["match_score"], result.get("requirements_source"))
 
-        return jsonify({
-            "jd_analysis": result["jd_analysis"],
-            "resume_analysis": result["resume_analysis"],
-            "gap_report": result["gap_report"],
-            "match_score": result["match_score"],
-            "jd_hash": result.get("jd_hash"),
-            "resume_hash": result.get("resume_hash"),
-            "requirements_version": result.get("requirements_version"),
-            "requirements_source": result.get("requirements_source"),
-            "requirements_artifact_path": result.get("requirements_artifact_path"),
-            "num_requirements": result.get("num_requirements"),
-            "must_have_coverage": result.get("must_have_coverage"),
-            "nice_to_have_coverage": result.get("nice_to_have_coverage"),
-        })
+        return jsonify({k: result.get(k) for k in _ANALYZE_RESPONSE_KEYS})
     except FileNotFoundError as e:
         audit_log(
             action="analyze",
@@ -273,12 +330,14 @@ def api_tailor():
 
     log.info("Tailor started (api_key_set=%s)", bool(api_key))
     try:
+        from gap_analyzer.web_service import tailor_resume
+
         tailored = tailor_resume(api_key, original_resume, jd_text, use_mock)
         audit_log(
             action="tailor",
             status="success",
             use_mock=use_mock,
-            model=MODEL if not use_mock else None,
+            model=_web_model() if not use_mock else None,
             jd_char_count=len(jd_text),
             resume_char_count=len(original_resume),
             extra={"output_char_count": len(tailored)},
@@ -313,12 +372,14 @@ def api_refine():
 
     log.info("Refine started (api_key_set=%s, instructions_len=%d)", bool(api_key), len(instructions))
     try:
+        from gap_analyzer.web_service import refine_resume
+
         tailored = refine_resume(api_key, original_resume, jd_text, instructions, use_mock)
         audit_log(
             action="refine",
             status="success",
             use_mock=use_mock,
-            model=MODEL if not use_mock else None,
+            model=_web_model() if not use_mock else None,
             jd_char_count=len(jd_text),
             resume_char_count=len(original_resume),
             extra={"instructions_len": len(instructions), "output_char_count": len(tailored)},
@@ -347,14 +408,13 @@ def api_upload():
     log.info("Upload started: filename=%s", file.filename)
     try:
         if file.content_type == "application/pdf" or file.filename.lower().endswith(".pdf"):
-            tmp = Path(os.environ.get("TMPDIR", "/tmp")) / f"gap_analyzer_{os.getpid()}_{file.filename}"
-            file.save(tmp)
+            text = extract_text_in_pool(file.read())
+        else:
+            reader = io.TextIOWrapper(file.stream, encoding="utf-8", errors="replace", newline="")
             try:
-                text = extract_text_from_pdf(tmp)
+                text = reader.read()
             finally:
-                tmp.unlink(missing_ok=True)
-        else:
-            text = file.read().decode("utf-8", errors="replace")
+                reader.detach()  # leave the upload stream to werkzeug
 
         audit_log(
             action="upload",
@@ -384,17 +444,29 @@ def _get_master_file() -> Path | None:
     return None
 
 
+# (path, mtime_ns, size, data) of the last parsed master resume; parsing a PDF is the slow part.
+# Callers get a copy of data (its values are strings, so a shallow copy suffices).
+_MASTER_CACHE: tuple[str, int, int, dict] | None = None
+
+
 def _read_master_resume() -> dict:
     """Read master resume from folder. Returns {text, filename} or {text: None}."""
+    global _MASTER_CACHE
     path = _get_master_file()
     if not path:
         return {"text": None, "filename": None}
     try:
+        st = path.stat()
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        if _MASTER_CACHE is not None and _MASTER_CACHE[:3] == key:
+            return dict(_MASTER_CACHE[3])
         if path.suffix.lower() == ".pdf":
             text = extract_text_from_pdf(path)
         else:
             text = path.read_text(encoding="utf-8", errors="replace")
-        return {"text": text, "filename": path.name}
+        data = {"text": text, "filename": path.name}
+        _MASTER_CACHE = (*key, data)
+        return dict(data)
     except Exception as e:
         log.warning("Failed to read master resume: %s", e)
         return {"text": None, "filename": None}
@@ -410,14 +482,24 @@ def api_get_master_resume():
 @app.route("/api/master-resume", methods=["POST"])
 def api_set_master_resume():
     """Save uploaded PDF/TXT to master folder. Overwrites any existing master file."""
+    global _MASTER_CACHE
     if "file" not in request.files:
         return jsonify({"error": "No file provided"}), 400
     file = request.files["file"]
     if file.filename == "":
         return jsonify({"error": "No file selected"}), 400
-    if not file.filename.lower().endswith((".pdf", ".txt")):
+    # Browsers send empty or odd part Content-Types (e.g. application/force-download), so the
+    # extension decides and PDFs must start with the %PDF- signature.
+    is_pdf = file.filename.lower().endswith(".pdf")
+    if not (is_pdf or file.filename.lower().endswith(".txt")):
         return jsonify({"error": "Only PDF and TXT files are allowed"}), 400
+    if is_pdf:
+        signature = file.stream.read(5)
+        file.stream.seek(0)
+        if signature != b"%PDF-":
+            return jsonify({"error": "File is not a valid PDF"}), 400
     log.info("Saving master resume: filename=%s", file.filename)
+    _MASTER_CACHE = None
     try:
         MASTER_DIR.mkdir(parents=True, exist_ok=True)
         # Remove any existing master file (keep only one)
@@ -426,7 +508,8 @@ def api_set_master_resume():
                 f.unlink()
         # Save the new file
         save_path = MASTER_DIR / file.filename
-        file.save(str(save_path))
+        with open(save_path, "wb") as out:
+            shutil.copyfileobj(file.stream, out, length=64 * 1024)
         data = _read_master_resume()
         log.info("Master resume saved to %s", save_path)
         return jsonify(data)
@@ -435,10 +518,28 @@ def api_set_master_resume():
         return jsonify({"error": str(e)}), 500
 
 
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in r'\/:*?"<>|'})
+
+
 def _sanitize_folder_name(name: str) -> str:
     """Convert company name to safe folder name."""
-    safe = "".join(c if c not in r'\/:*?"<>|' else "_" for c in name)
-    return safe.strip() or "General"
+    return name.translate(_SANITIZE_TABLE).strip() or "General"
+
+
+# (pdf_key, mtime_ns, size) of each tailored PDF this process saved. While the file's stat still
+# matches, it holds that render, so a repeat download of the same text skips reportlab.
+_SAVED_PDFS: dict[Path, tuple[str, int, int]] = {}
+
+
+def _saved_pdf_is_current(path: Path, pdf_key: str) -> bool:
+    entry = _SAVED_PDFS.get(path)
+    if entry is None or entry[0] != pdf_key:
+        return False
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return False
+    return (st.st_mtime_ns, st.st_size) == entry[1:]
 
 
 @app.route("/api/download-pdf", methods=["POST"])
@@ -454,25 +555,47 @@ def api_download_pdf():
 
     log.info("Download PDF: candidate=%s, company=%s", candidate_name, company_name)
     try:
-        pdf_bytes = generate_tailored_pdf(tailored_text, candidate_name)
         filename = f"{candidate_name.replace(' ', '_')}_Tailored_Resume.pdf"
-        save_dir = RESUMES_DIR / company_name
-        save_dir.mkdir(parents=True, exist_ok=True)
-        save_path = save_dir / filename
-        save_path.write_bytes(pdf_bytes)
-        log.info("Saved to %s", save_path)
+        # The ETag is keyed on what the PDF is rendered from; the saved copy keeps its stable name
+        # and is re-rendered only when the text (or the file) changed.
+        pdf_key = hash_text(f"{candidate_name}\0{tailored_text}")
+        save_path = RESUMES_DIR / company_name / filename
+        if not _saved_pdf_is_current(save_path, pdf_key):
+            from gap_analyzer.tailored_pdf import generate_tailored_pdf_to
+
+            with atomic_open(save_path) as out:
+                generate_tailored_pdf_to(out, tailored_text, candidate_name)
+            st = save_path.stat()
+            _SAVED_PDFS[save_path] = (pdf_key, st.st_mtime_ns, st.st_size)
+            log.info("Saved to %s", save_path)
         audit_log(
             action="download_pdf",
             status="success",
             filename=filename,
-            extra={"candidate_name": candidate_name, "company_name": company_name, "save_path": str(save_path), "pdf_bytes": len(pdf_bytes)},
+            extra={"candidate_name": candidate_name, "company_name": company_name, "save_path": str(save_path), "pdf_bytes": save_path.stat().st_size},
         )
-        from io import BytesIO
+        # Werkzeug only evaluates If-None-Match on GET/HEAD, so this POST route checks it itself
+        if request.if_none_match.contains(pdf_key):
+            resp = app.response_class(status=304)
+            resp.set_etag(pdf_key)
+            return resp
+        accel_prefix = os.getenv("PDF_ACCEL_REDIRECT_PREFIX", "")
+        if accel_prefix:
+            # Behind nginx: hand the file off via an internal location so it is sent zero-copy.
+            rel = save_path.relative_to(RESUMES_DIR).as_posix()
+            resp = app.response_class(mimetype="application/pdf")
+            resp.headers["X-Accel-Redirect"] = accel_prefix.rstrip("/") + "/" + quote(rel)
+            resp.headers.set("Content-Disposition", "attachment", filename=filename)
+            resp.set_etag(pdf_key)
+            return resp
+        # Sent from the saved file (no second in-memory copy) with the content-derived ETag.
         return send_file(
-            BytesIO(pdf_bytes),
+            save_path,
             mimetype="application/pdf",
             as_attachment=True,
             download_name=filename,
+            conditional=True,
+            etag=pdf_key,
         )
     except Exception as e:
         audit_log(action="download_pdf", status="error", error=str(e))
@@ -488,4 +611,4 @@ if __name__ == "__main__":
     )
     if not api_key_set:
         log.warning("GROQ_API_KEY not found in .env - analysis will fail until it is set")
-    app.run(debug=True, port=5000)
+    app.run(debug=True, port=5000, threaded=True)
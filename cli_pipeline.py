@@ -6,6 +6,7 @@ import json
 import os
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -15,7 +16,7 @@ load_dotenv()
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from gap_analyzer import extract_text_from_pdf
+from gap_analyzer import extract_text_from_pdf_cached
 from src.pipeline.extract import extract_requirements_from_jd
 from src.pipeline.artifacts import save_requirements_artifact, load_requirements_artifact, save_evidence_artifact
 from src.pipeline.match import match_resume_to_requirements
@@ -51,27 +52,28 @@ def cmd_create_requirements(args: argparse.Namespace) -> None:
     print(f"  requirements_count: {len(requirements_doc['requirements'])}")
 
 
-def cmd_evaluate(args: argparse.Namespace) -> None:
-    """Stage C+D: Load frozen requirements, match resume, deterministic score."""
-    api_key = _get_api_key(args.api_key)
-    resume_path = Path(args.resume)
-    if not resume_path.exists():
-        print(f"Error: Resume not found: {resume_path}", file=sys.stderr)
-        sys.exit(1)
+def _read_resume_text(resume_path: Path) -> str:
+    if resume_path.suffix.lower() != ".pdf":
+        return resume_path.read_text(encoding="utf-8")
+    # Cached on disk, so re-evaluating a resume skips parsing
+    return extract_text_from_pdf_cached(resume_path)
 
-    # Extract resume text
-    if resume_path.suffix.lower() == ".pdf":
-        resume_text = extract_text_from_pdf(resume_path)
-    else:
-        resume_text = resume_path.read_text(encoding="utf-8")
 
-    role_id = args.role_id
-    jd_hash = args.jd_hash
-    if not role_id or not jd_hash:
+def _require_role_and_hash(args: argparse.Namespace) -> None:
+    if not args.role_id or not args.jd_hash:
         print("Error: --role-id and --jd-hash required for evaluation. Use values from create-requirements.", file=sys.stderr)
         sys.exit(1)
 
-    requirements_doc = load_requirements_artifact(role_id, jd_hash)
+
+def _match_and_score(
+    api_key: str,
+    resume_text: str,
+    requirements_doc: dict,
+    role_id: str,
+    jd_hash: str,
+    reports_dir: Path,
+) -> tuple[dict, dict, Path]:
+    """Stage C+D for one resume: match, validate, score, save evidence + run report."""
     evidence_map = match_resume_to_requirements(api_key, resume_text, requirements_doc)
     validate_evidence_map_schema(evidence_map)
     run_id = evidence_map.get("run_id", str(uuid.uuid4())[:8])
@@ -84,7 +86,6 @@ def cmd_evaluate(args: argparse.Namespace) -> None:
     save_evidence_artifact(evidence_map)
 
     # Write run report
-    reports_dir = Path(args.reports_dir)
     report_path = reports_dir / f"run_report_{run_id}.json"
     write_run_report(
         report_path,
@@ -99,6 +100,26 @@ def cmd_evaluate(args: argparse.Namespace) -> None:
         total_requirements=total_reqs,
         total_matched=total_matched,
     )
+    return score_result, evidence_map, report_path
+
+
+def cmd_evaluate(args: argparse.Namespace) -> None:
+    """Stage C+D: Load frozen requirements, match resume, deterministic score."""
+    api_key = _get_api_key(args.api_key)
+    resume_path = Path(args.resume)
+    if not resume_path.exists():
+        print(f"Error: Resume not found: {resume_path}", file=sys.stderr)
+        sys.exit(1)
+
+    # Extract resume text
+    resume_text = _read_resume_text(resume_path)
+
+    _require_role_and_hash(args)
+
+    requirements_doc = load_requirements_artifact(args.role_id, args.jd_hash)
+    score_result, evidence_map, report_path = _match_and_score(
+        api_key, resume_text, requirements_doc, args.role_id, args.jd_hash, Path(args.reports_dir)
+    )
     print(f"Run report: {report_path}")
 
     # Output
@@ -119,6 +140,67 @@ def cmd_evaluate(args: argparse.Namespace) -> None:
             print(f"  {cat}: {d['matched']}/{d['total']} ({d['pct']}%)")
 
 
+def _evaluate_resume_file(
+    api_key: str,
+    resume_path: Path,
+    requirements_doc: dict,
+    role_id: str,
+    jd_hash: str,
+    reports_dir: Path,
+) -> tuple[dict, dict, Path]:
+    """Read one resume and run _match_and_score on it, so extraction errors are reported per resume."""
+    return _match_and_score(api_key, _read_resume_text(resume_path), requirements_doc, role_id, jd_hash, reports_dir)
+
+
+def cmd_evaluate_batch(args: argparse.Namespace) -> None:
+    """Stage C+D for every resume in a directory against one frozen requirements artifact."""
+    api_key = _get_api_key(args.api_key)
+    resumes_dir = Path(args.resumes_dir)
+    if not resumes_dir.is_dir():
+        print(f"Error: Resumes directory not found: {resumes_dir}", file=sys.stderr)
+        sys.exit(1)
+    resume_paths = sorted(
+        p for p in resumes_dir.iterdir() if p.is_file() and p.suffix.lower() in (".pdf", ".txt")
+    )
+    if not resume_paths:
+        print(f"Error: No PDF or TXT resumes in {resumes_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    # Requirements are loaded once and shared (read-only) by every match call
+    requirements_doc = load_requirements_artifact(args.role_id, args.jd_hash)
+    reports_dir = Path(args.reports_dir)
+
+    # Match calls are network-bound; overlap them. Groq 429s are retried with backoff by the client.
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as ex:
+        futures = [
+            ex.submit(_evaluate_resume_file, api_key, path, requirements_doc, args.role_id, args.jd_hash, reports_dir)
+            for path in resume_paths
+        ]
+        results = []
+        for path, fut in zip(resume_paths, futures):
+            try:
+                score_result, _, report_path = fut.result()
+                results.append({"resume": str(path), "score": score_result, "run_report": str(report_path)})
+            except Exception as e:
+                results.append({"resume": str(path), "error": str(e)})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("=== Batch scores ===")
+        for r in results:
+            if "error" in r:
+                print(f"  {r['resume']}: ERROR {r['error']}")
+            else:
+                s = r["score"]
+                print(
+                    f"  {r['resume']}: overall {s['overall_score']}% "
+                    f"(must-have {s['must_have_coverage']}%, nice-to-have {s['nice_to_have_coverage']}%)"
+                )
+    if any("error" in r for r in results):
+        sys.exit(1)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Deterministic resume-to-job matching pipeline")
     parser.add_argument("--api-key", help="Groq API key (or GROQ_API_KEY env)")
@@ -139,6 +221,16 @@ def main() -> None:
     p_eval.add_argument("--json", action="store_true", help="Output JSON")
     p_eval.set_defaults(func=cmd_evaluate)
 
+    # evaluate-batch
+    p_batch = sub.add_parser("evaluate-batch", help="Stage C+D: Evaluate every resume in a directory against frozen requirements")
+    p_batch.add_argument("resumes_dir", type=Path, help="Directory of resume PDF or text files")
+    p_batch.add_argument("--role-id", required=True, help="Role ID from create-requirements")
+    p_batch.add_argument("--jd-hash", required=True, help="JD hash from create-requirements")
+    p_batch.add_argument("--concurrency", type=int, default=8, help="Concurrent Groq match calls (default: 8)")
+    p_batch.add_argument("--reports-dir", type=Path, default=Path("artifacts"), help="Directory for run_report.json files")
+    p_batch.add_argument("--json", action="store_true", help="Output JSON")
+    p_batch.set_defaults(func=cmd_evaluate_batch)
+
     args = parser.parse_args()
     args.func(args)
 
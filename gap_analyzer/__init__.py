@@ -1,7 +1,34 @@
 """Gap Analyzer - Job Description & Résumé Gap Analysis using Groq AI."""
 
-from gap_analyzer.pdf_parser import extract_text_from_pdf
-from gap_analyzer.analyzer import GapAnalyzer
-from gap_analyzer.pdf_generator import ResumePDFGenerator
+from gap_analyzer.pdf_parser import (
+    extract_text_from_pdf,
+    extract_text_from_pdf_bytes,
+    extract_text_from_pdf_cached,
+    iter_pages_text,
+)
 
-__all__ = ["extract_text_from_pdf", "GapAnalyzer", "ResumePDFGenerator"]
+__all__ = [
+    "extract_text_from_pdf",
+    "extract_text_from_pdf_bytes",
+    "extract_text_from_pdf_cached",
+    "iter_pages_text",
+    "GapAnalyzer",
+    "ResumePDFGenerator",
+]
+
+# GapAnalyzer (groq) and ResumePDFGenerator (reportlab) are resolved on first
+# access so importing a submodule such as pdf_parser stays cheap.
+_LAZY = {
+    "GapAnalyzer": "gap_analyzer.analyzer",
+    "ResumePDFGenerator": "gap_analyzer.pdf_generator",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
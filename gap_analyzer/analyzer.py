@@ -1,25 +1,149 @@
 """AI-powered gap analysis between Job Descriptions and Résumés using Groq."""
 
+import asyncio
+import hashlib
+import importlib.util
 import json
 import os
-from groq import Groq
-from dotenv import load_dotenv
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
-load_dotenv()
+from src.utils import clone_json
 
-DEFAULT_MODEL = "llama-3.1-70b-versatile"
+if TYPE_CHECKING:
+    from groq import AsyncGroq, DefaultHttpxClient
+
+# 8B-instant handles the structured gap report on the common path at roughly twice the
+# speed of 70B; replies that are not valid, complete JSON are retried on FALLBACK_MODEL.
+DEFAULT_MODEL = "llama-3.1-8b-instant"
+FALLBACK_MODEL = "llama-3.3-70b-versatile"
+REQUIRED_KEYS = ("strengths", "gaps", "recommendations", "keywords_to_add", "fit_score", "fit_justification")
+# Per-document input budget; longer JDs/résumés keep their head and tail.
+MAX_INPUT_TOKENS = 2000
+# Deterministic sampling so a cached analysis is the answer the model would give again.
+TEMPERATURE = 0
+
+# One keep-alive connection pool for every GapAnalyzer, so constructing an analyzer per
+# request does not pay a fresh TCP+TLS handshake. HTTP/2 when the optional h2 package is present.
+# Created with the first analyzer; groq/httpx are imported there, not at module import.
+_HTTP: "DefaultHttpxClient | None" = None
+_HTTP_LOCK = threading.Lock()
+
+
+def _http_client() -> "DefaultHttpxClient":
+    global _HTTP
+    with _HTTP_LOCK:
+        if _HTTP is None:
+            import httpx
+            from groq import DefaultHttpxClient
+
+            _HTTP = DefaultHttpxClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=importlib.util.find_spec("h2") is not None,
+            )
+        return _HTTP
+
+# In-flight requests per analyze_many call; keeps bursts under Groq's TPM limits.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Analyses keyed on (model, temperature, hash of the whitespace-normalized prompt), so
+# re-running the same JD/résumé pair (including re-extracted PDFs that differ only in
+# spacing) skips Groq.
+RESPONSE_CACHE_SIZE = 1024
+_RESPONSE_CACHE: OrderedDict[tuple[str, float, str], str | dict] = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _truncate(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+    """Cap text at ~max_tokens (4 chars/token), keeping the head and tail."""
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    return text[:half] + "\n...\n" + text[-half:]
+
+
+def _normalized_prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(" ".join(prompt.split()).encode("utf-8")).hexdigest()
+
+
+class _JsonFieldScanner:
+    """
+    Incrementally splits a streamed JSON object into its top-level fields.
+
+    Tracks string/escape state and nesting depth; each time a depth-1 field closes
+    (at ',' or the final '}') it is decoded and returned as (key, value). Text before
+    the opening brace (e.g. a markdown fence) is ignored.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._field: list[str] = []
+
+    def feed(self, text: str) -> list[tuple[str, object]]:
+        done = []
+        for ch in text:
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                continue
+            if self._in_string:
+                self._field.append(ch)
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+            if ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                self._depth += 1
+            elif ch in "]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    done.extend(self._flush())
+                    continue
+            elif ch == "," and self._depth == 1:
+                done.extend(self._flush())
+                continue
+            self._field.append(ch)
+        return done
+
+    def _flush(self) -> list[tuple[str, object]]:
+        text = "".join(self._field).strip()
+        self._field = []
+        if not text:
+            return []
+        try:
+            return list(json.loads("{" + text + "}").items())
+        except json.JSONDecodeError:
+            return []
 
 
 class GapAnalyzer:
-    """Analyzes the gap between a Job Description and a Résumé using Groq (Llama 3)."""
+    """
+    Analyzes the gap between a Job Description and a Résumé using Groq (Llama 3).
+
+    Reuse one instance where you can; instances share the module's HTTP connection pool.
+    """
 
     def __init__(self, api_key: str | None = None, model: str = DEFAULT_MODEL):
+        from dotenv import load_dotenv
+        from groq import Groq
+
+        load_dotenv()
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "GROQ_API_KEY is required. Set it in .env or pass api_key to GapAnalyzer."
             )
-        self.client = Groq(api_key=self.api_key)
+        self.client = Groq(api_key=self.api_key, http_client=_http_client())
         self.model = model
 
     def analyze(
@@ -40,67 +164,171 @@ class GapAnalyzer:
             Analysis text, or a dict if structured=True and parsing succeeds.
         """
         prompt = self._build_prompt(job_description, resume_text, structured)
+        key = (self.model, TEMPERATURE, _normalized_prompt_hash(prompt))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = self._parse(self._complete(self.model, prompt, structured), structured)
+        if self._needs_fallback(result, structured):
+            result = self._parse(self._complete(FALLBACK_MODEL, prompt, structured), structured)
+        return self._cache_put(key, result)
 
-        response = self.client.chat.completions.create(
+    def analyze_stream(
+        self,
+        job_description: str,
+        resume_text: str,
+        structured: bool = False,
+    ) -> Iterator[str | tuple[str, object]]:
+        """
+        Stream an analysis as the model generates it.
+
+        Yields text deltas when structured=False. When structured=True, yields (key, value)
+        for each top-level field of the JSON report as soon as that field is complete.
+        The finished analysis is cached like analyze(); a structured report missing any
+        REQUIRED_KEYS field is not.
+        """
+        prompt = self._build_prompt(job_description, resume_text, structured)
+        key = (self.model, TEMPERATURE, _normalized_prompt_hash(prompt))
+        cached = self._cache_get(key)
+        if cached is not None:
+            if structured:
+                yield from cached.items()
+            else:
+                yield cached
+            return
+
+        stream = self.client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
+            temperature=TEMPERATURE,
+            stream=True,
         )
+        parts = []
+        report: dict = {}
+        fields = _JsonFieldScanner() if structured else None
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            if fields is None:
+                yield delta
+                continue
+            for name, value in fields.feed(delta):
+                report[name] = value
+                # The report goes into the shared cache; callers get their own copy
+                yield name, clone_json(value)
+        # Streamed replies are not in JSON mode, so keep the scanned fields (fences and all)
+        result = report if report else self._parse("".join(parts), structured)
+        # The scanner drops fields it cannot decode; a partial report must not be served by
+        # analyze() from the shared cache, which would skip FALLBACK_MODEL.
+        if structured and (not isinstance(result, dict) or any(k not in result for k in REQUIRED_KEYS)):
+            return
+        self._cache_put(key, result)
+
+    async def analyze_many(
+        self,
+        pairs: list[tuple[str, str]],
+        structured: bool = True,
+    ) -> list[str | dict]:
+        """
+        Analyze several (job_description, resume_text) pairs concurrently.
+
+        Requests run in parallel on an async client opened (and closed) by this call, at most
+        MAX_CONCURRENT_REQUESTS at a time; cached pairs are answered without a call.
+
+        Returns:
+            One result per pair, in input order, as analyze() would return it.
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-        content = response.choices[0].message.content.strip()
+        async with self._async_client() as aclient:
 
+            async def one(jd: str, resume: str) -> str | dict:
+                prompt = self._build_prompt(jd, resume, structured)
+                key = (self.model, TEMPERATURE, _normalized_prompt_hash(prompt))
+                cached = self._cache_get(key)
+                if cached is not None:
+                    return cached
+                async with sem:
+                    result = self._parse(await self._acomplete(aclient, self.model, prompt, structured), structured)
+                    if self._needs_fallback(result, structured):
+                        result = self._parse(
+                            await self._acomplete(aclient, FALLBACK_MODEL, prompt, structured), structured
+                        )
+                return self._cache_put(key, result)
+
+            return list(await asyncio.gather(*(one(jd, resume) for jd, resume in pairs)))
+
+    def _async_client(self) -> "AsyncGroq":
+        """Async client for one analyze_many call; sync-only paths never build one."""
+        from groq import AsyncGroq
+
+        return AsyncGroq(api_key=self.api_key)
+
+    def _cache_get(self, key: tuple[str, float, str]) -> str | dict | None:
+        with _RESPONSE_CACHE_LOCK:
+            if key in _RESPONSE_CACHE:
+                _RESPONSE_CACHE.move_to_end(key)
+                return clone_json(_RESPONSE_CACHE[key])
+        return None
+
+    def _cache_put(self, key: tuple[str, float, str], result: str | dict) -> str | dict:
+        """Store a result in the response cache and return a private copy."""
+        with _RESPONSE_CACHE_LOCK:
+            _RESPONSE_CACHE[key] = result
+            if len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+        return clone_json(result)
+
+    def _request_kwargs(self, model: str, prompt: str, structured: bool) -> dict:
+        kwargs = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": TEMPERATURE,
+        }
         if structured:
-            try:
-                return self._parse_structured_response(content)
-            except json.JSONDecodeError:
-                return {"raw_analysis": content}
+            # JSON mode: the reply is a bare JSON object, never fenced
+            kwargs["response_format"] = {"type": "json_object"}
+        return kwargs
 
-        return content
+    def _complete(self, model: str, prompt: str, structured: bool) -> str:
+        response = self.client.chat.completions.create(**self._request_kwargs(model, prompt, structured))
+        return response.choices[0].message.content
 
-    def _build_prompt(self, jd: str, resume: str, structured: bool) -> str:
-        base = """You are an expert career coach and recruiter. Analyze the gap between the following Job Description and Résumé.
-
-Job Description:
----
-{jd}
----
-
-Résumé:
----
-{resume}
----
-
-Provide a detailed gap analysis that includes:
-1. **Strengths**: Where the candidate aligns well with the role.
-2. **Gaps**: Missing skills, experience, or qualifications.
-3. **Recommendations**: Specific, actionable steps to bridge the gap (skills to learn, experience to highlight, phrasing to add).
-4. **Keywords to add**: Important JD keywords the résumé should include.
-5. **Overall fit score** (1-10) with brief justification.
-"""
+    async def _acomplete(self, aclient: "AsyncGroq", model: str, prompt: str, structured: bool) -> str:
+        response = await aclient.chat.completions.create(**self._request_kwargs(model, prompt, structured))
+        return response.choices[0].message.content
+
+    def _parse(self, content: str, structured: bool) -> str | dict:
+        content = content.strip()
+        if not structured:
+            return content
+        try:
+            return self._parse_structured_response(content)
+        except json.JSONDecodeError:
+            return {"raw_analysis": content}
+
+    def _needs_fallback(self, result: str | dict, structured: bool) -> bool:
+        """Escalate to FALLBACK_MODEL when a structured reply is unparseable or incomplete."""
+        if not structured or self.model == FALLBACK_MODEL:
+            return False
+        return not isinstance(result, dict) or any(k not in result for k in REQUIRED_KEYS)
 
+    def _build_prompt(self, jd: str, resume: str, structured: bool) -> str:
         if structured:
-            base += """
-Respond with valid JSON only, no markdown code blocks. Use this structure:
-{
-  "strengths": ["...", "..."],
-  "gaps": ["...", "..."],
-  "recommendations": ["...", "..."],
-  "keywords_to_add": ["...", "..."],
-  "fit_score": 7,
-  "fit_justification": "..."
-}
-"""
-
-        return base.format(jd=jd, resume=resume)
+            task = (
+                "Gap-analyze the job description (JD) against the résumé. Return JSON: "
+                '{"strengths": [str], "gaps": [str], "recommendations": [str], '
+                '"keywords_to_add": [str], "fit_score": int 1-10, "fit_justification": str}'
+            )
+        else:
+            task = (
+                "Gap-analyze the job description (JD) against the résumé: strengths, gaps, "
+                "actionable recommendations, JD keywords to add, and a 1-10 fit score with justification."
+            )
+        return f"{task}\n\nJD:\n{_truncate(jd)}\n\nRésumé:\n{_truncate(resume)}"
 
     def _parse_structured_response(self, content: str) -> dict:
-        # Remove markdown code blocks if present
-        text = content.strip()
-        if text.startswith("```"):
-            lines = text.split("\n")
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
-        return json.loads(text)
+        return json.loads(content)
@@ -1,11 +1,27 @@
 """Audit trail for model runs and API operations."""
 
+import atexit
 import csv
+import gzip
+import io
 import json
 import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking; single-process dev server only
+    fcntl = None
+
 AUDIT_DIR = Path(__file__).resolve().parent.parent / "logs"
 AUDIT_FILE = AUDIT_DIR / "audit.log"
 APP_LOG_FILE = AUDIT_DIR / "app.log"
@@ -45,12 +61,208 @@ CSV_HEADERS = [
 ]
 
 
+# Size caps for the log files. Full segments are gzip-compressed beside the live file
+# (app.<utc-ts>.log.gz, model_performance.<utc-ts>.jsonl.gz, ...) and the live file starts
+# afresh; only the newest APP_LOG_BACKUP_COUNT app.log segments (AUDIT_BACKUP_COUNT for the
+# audit and model-performance logs) are kept.
+APP_LOG_MAX_BYTES = int(os.environ.get("APP_LOG_MAX_BYTES", str(50 * 1024 * 1024)))
+APP_LOG_BACKUP_COUNT = int(os.environ.get("APP_LOG_BACKUP_COUNT", "10"))
+AUDIT_MAX_BYTES = int(os.environ.get("AUDIT_MAX_BYTES", str(50 * 1024 * 1024)))
+AUDIT_BACKUP_COUNT = int(os.environ.get("AUDIT_BACKUP_COUNT", "10"))
+
+
 def _ensure_log_dir():
     AUDIT_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Audit writes are handed to a single daemon writer so request handlers only pay
+# for building the entry; JSON/CSV encoding and file IO happen off-thread, batched:
+# the writer collects up to AUDIT_BUFFER_SIZE entries (or AUDIT_FLUSH_INTERVAL seconds'
+# worth) and appends each batch with one write per file.
+AUDIT_FLUSH_INTERVAL = float(os.environ.get("AUDIT_FLUSH_INTERVAL", "0.1"))
+AUDIT_BUFFER_SIZE = int(os.environ.get("AUDIT_BUFFER_SIZE", "500"))
+_AUDIT_Q: queue.Queue = queue.Queue(maxsize=10000)
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+# Serializes appends within the process (writer thread, queue-full inline fallback, app log
+# handler). Reentrant so a log call made while holding it cannot deadlock.
+_write_lock = threading.RLock()
+# Append-only fds for the JSONL and CSV logs, opened once per path (O_APPEND) and closed at exit.
+# Other worker processes may rotate a file under us; see _append.
+_append_fds: dict[Path, int] = {}
+
+
+def _drain():
+    while True:
+        batch = [_AUDIT_Q.get()]
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+        while len(batch) < AUDIT_BUFFER_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_AUDIT_Q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception:
+            logging.getLogger("gap_analyzer").exception("Audit write failed")
+        finally:
+            for _ in batch:
+                _AUDIT_Q.task_done()
+
+
+def _submit(kind: str, entry: dict):
+    """Queue an entry ("audit" or "perf") for the background writer; write inline if the queue is full."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_drain, name="audit-writer", daemon=True)
+                _writer.start()
+                # atexit runs LIFO: flush queued entries, then close the append fds
+                atexit.register(_close_append_fds)
+                atexit.register(flush_audit)
+    try:
+        _AUDIT_Q.put_nowait((kind, entry))
+    except queue.Full:
+        _write_batch([(kind, entry)])
+
+
+def flush_audit():
+    """Block until every queued audit write has reached disk."""
+    if _writer is not None:
+        _AUDIT_Q.join()
+
+
+def _write_batch(batch: list[tuple[str, dict]]):
+    audit_entries = [entry for kind, entry in batch if kind == "audit"]
+    perf_entries = [entry for kind, entry in batch if kind == "perf"]
+    rotated = []
+    with _write_lock:
+        if audit_entries:
+            rotated.append(_append(AUDIT_FILE, b"".join(_jsonl(e) for e in audit_entries)))
+        if perf_entries:
+            rotated.extend(_write_model_performance(perf_entries))
+    # Compress outside _write_lock so log calls are not held up behind gzip
+    for segment in rotated:
+        if segment is not None:
+            _compress_segment(segment, AUDIT_BACKUP_COUNT)
+
+
+# JSONL encoding for the audit and model-performance logs: orjson emits UTF-8 bytes with
+# the newline attached, so batches are joined and appended without a decode/encode pass.
+_JSONL_OPTS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+
+def _jsonl(entry: dict) -> bytes:
+    return orjson.dumps(entry, default=str, option=_JSONL_OPTS)
+
+
+@contextmanager
+def _locked(fd: int):
+    """Exclusive flock on fd's file, shared by every process appending to or rotating it."""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+def _is_stale(fd: int, path: Path) -> bool:
+    """True if path no longer names the file fd is open on (rotated by another process)."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return True
+    held = os.fstat(fd)
+    return (st.st_dev, st.st_ino) != (held.st_dev, held.st_ino)
+
+
+def _append(path: Path, data: bytes, header: bytes = b"", max_bytes: int | None = None) -> Path | None:
+    """
+    Append bytes to path through its long-lived O_APPEND fd (callers hold _write_lock).
+
+    header is written first when the file is empty. The file rotates at max_bytes (default
+    AUDIT_MAX_BYTES): under the file lock, an fd whose file was rotated away by another worker
+    is reopened before writing, and a full file is renamed aside before the lock is released,
+    so no process appends to a segment being compressed. Returns the renamed-aside segment (or
+    None); the caller passes it to _compress_segment after releasing _write_lock.
+    """
+    while True:
+        fd = _append_fds.get(path)
+        if fd is None:
+            fd = _append_fds[path] = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        segment = None
+        with _locked(fd):
+            stale = _is_stale(fd, path)
+            if not stale:
+                view = memoryview(header + data if header and os.fstat(fd).st_size == 0 else data)
+                while view:
+                    view = view[os.write(fd, view):]
+                if os.fstat(fd).st_size >= (AUDIT_MAX_BYTES if max_bytes is None else max_bytes):
+                    segment = _move_aside(path)
+        if stale or segment is not None:
+            os.close(_append_fds.pop(path))
+        if not stale:
+            break
+    return segment
+
+
+def _compress_segment(segment: Path, keep: int):
+    """Gzip a segment renamed aside by _append; keep > 0 deletes all but the newest keep .gz segments."""
+    _gzip_file(segment, f"{segment}.gz")
+    if keep > 0:
+        stem = segment.name.partition(".")[0]
+        for old in sorted(segment.parent.glob(f"{stem}.*{segment.suffix}.gz"))[:-keep]:
+            old.unlink(missing_ok=True)
+
+
+def _gzip_file(source: str | Path, dest: str | Path):
+    """Compress source into dest and remove source."""
+    with open(source, "rb") as src, gzip.open(dest, "wb") as out:
+        shutil.copyfileobj(src, out, 1024 * 1024)
+    os.remove(source)
+
+
+def _move_aside(path: Path) -> Path:
+    """Rename a full log file to a timestamped segment name (gzipped by the caller)."""
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    segment = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+    os.replace(path, segment)
+    return segment
+
+
+def _close_append_fds():
+    while _append_fds:
+        os.close(_append_fds.popitem()[1])
+
+
+def _csv_line(row) -> bytes:
+    buf = io.StringIO()
+    csv.writer(buf).writerow(row)
+    return buf.getvalue().encode("utf-8")
+
+
+_CSV_HEADER = _csv_line(CSV_HEADERS)
+
+
+# (epoch second, formatted "%Y-%m-%dT%H:%M:%S") of the last stamp; entries in the same
+# second only format their milliseconds.
+_ts_second: tuple[int, str] = (-1, "")
+
+
 def _iso_ts():
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    global _ts_second
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached = _ts_second
+    if cached[0] != sec:
+        cached = _ts_second = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{cached[1]}.{ns // 1_000_000:03d}Z"
 
 
 def log_model_performance(
@@ -82,22 +294,31 @@ def log_model_performance(
 ):
     """
     Log model performance for later review: time, criteria, why it scored that way.
-    Writes to model_performance.json (append) and model_performance.csv.
+    Queues an append to model_performance.jsonl and model_performance.csv.
     """
     _ensure_log_dir()
     ts = _iso_ts()
 
     num_reqs = len(criteria_used)
-    num_matches = sum(1 for g in gap_report if g.get("status") == "MATCH")
-    num_missing = sum(1 for g in gap_report if g.get("status") == "MISSING")
-    num_gaps = sum(1 for g in gap_report if g.get("status") == "GAP")
+    # One pass over the report: MATCH count plus MISSING/GAP names
+    num_matches = 0
+    missing_names = []
+    gap_names = []
+    for g in gap_report:
+        status = g.get("status")
+        if status == "MATCH":
+            num_matches += 1
+        elif status == "MISSING":
+            missing_names.append(g["name"])
+        elif status == "GAP":
+            gap_names.append(g["name"])
+    num_missing = len(missing_names)
+    num_gaps = len(gap_names)
 
     rationale_parts = [f"{num_matches} of {num_reqs} requirements matched ({match_score}%)."]
     if num_missing:
-        missing_names = [g["name"] for g in gap_report if g.get("status") == "MISSING"]
         rationale_parts.append(f"Missing (must-have): {', '.join(missing_names)}.")
     if num_gaps:
-        gap_names = [g["name"] for g in gap_report if g.get("status") == "GAP"]
         rationale_parts.append(f"Gaps (nice-to-have): {', '.join(gap_names)}.")
     scoring_rationale = " ".join(rationale_parts)
 
@@ -134,50 +355,60 @@ def log_model_performance(
         "gap_details": gap_report,
     }
 
+    _submit("perf", entry)
+
+
+def _write_model_performance(entries: list[dict]) -> list[Path | None]:
+    """Append entries to the JSONL and CSV logs; returns their rotated segments (see _append)."""
     # Append to JSON (as JSONL for easy appending)
     jsonl_file = AUDIT_DIR / "model_performance.jsonl"
-    with open(jsonl_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, default=str) + "\n")
+    rotated = [_append(jsonl_file, b"".join(_jsonl(e) for e in entries))]
 
     # Append to CSV
-    csv_exists = MODEL_PERF_CSV.exists()
-    with open(MODEL_PERF_CSV, "a", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_HEADERS)
-        if not csv_exists:
-            writer.writeheader()
-        row = {
-            "timestamp": ts,
-            "model": model,
-            "use_mock": use_mock,
-            "match_score": match_score,
-            "role_title": role_title,
-            "candidate_name": candidate_name,
-            "num_requirements": num_reqs,
-            "num_matches": num_matches,
-            "num_missing": num_missing,
-            "num_gaps": num_gaps,
-            "jd_char_count": jd_char_count,
-            "resume_char_count": resume_char_count,
-            "jd_hash": jd_hash or "",
-            "resume_hash": resume_hash or "",
-            "requirements_version": requirements_version or "",
-            "requirements_source": requirements_source or "",
-            "requirements_artifact_path": requirements_artifact_path or "",
-            "requirements_hash": requirements_hash or "",
-            "prompt_version": prompt_version or "",
-            "prompt_hash": prompt_hash or "",
-            "model_params": json.dumps(model_params or {}),
-            "normalized_requirement_count": normalized_requirement_count or num_reqs,
-            "matched_count": matched_count or num_matches,
-            "matched_count_raw": matched_count_raw if matched_count_raw is not None else "",
-            "matched_count_validated": matched_count_validated if matched_count_validated is not None else "",
-            "invalid_quote_count": invalid_quote_count if invalid_quote_count is not None else "",
-            "evidence_prompt_includes_description": evidence_prompt_includes_description if evidence_prompt_includes_description is not None else "",
-            "scoring_rationale": scoring_rationale,
-            "criteria_used": json.dumps(criteria_used, default=str),
-            "gap_details": json.dumps(gap_report, default=str),
-        }
-        writer.writerow(row)
+    buf = io.StringIO()
+    csv.DictWriter(buf, fieldnames=CSV_HEADERS).writerows(_csv_row(e) for e in entries)
+    rotated.append(_append(MODEL_PERF_CSV, buf.getvalue().encode("utf-8"), header=_CSV_HEADER))
+    return rotated
+
+
+def _blank_if_none(value):
+    return value if value is not None else ""
+
+
+def _csv_row(entry: dict) -> dict:
+    """Flatten a model-performance entry for the CSV: blanks for None, nested values as JSON."""
+    return {
+        "timestamp": entry["timestamp"],
+        "model": entry["model"],
+        "use_mock": entry["use_mock"],
+        "match_score": entry["match_score"],
+        "role_title": entry["role_title"],
+        "candidate_name": entry["candidate_name"],
+        "num_requirements": entry["num_requirements"],
+        "num_matches": entry["num_matches"],
+        "num_missing": entry["num_missing"],
+        "num_gaps": entry["num_gaps"],
+        "jd_char_count": entry["jd_char_count"],
+        "resume_char_count": entry["resume_char_count"],
+        "jd_hash": entry["jd_hash"] or "",
+        "resume_hash": entry["resume_hash"] or "",
+        "requirements_version": entry["requirements_version"] or "",
+        "requirements_source": entry["requirements_source"] or "",
+        "requirements_artifact_path": entry["requirements_artifact_path"] or "",
+        "requirements_hash": entry["requirements_hash"] or "",
+        "prompt_version": entry["prompt_version"] or "",
+        "prompt_hash": entry["prompt_hash"] or "",
+        "model_params": json.dumps(entry["model_params"] or {}),
+        "normalized_requirement_count": entry["normalized_requirement_count"],
+        "matched_count": entry["matched_count"],
+        "matched_count_raw": _blank_if_none(entry["matched_count_raw"]),
+        "matched_count_validated": _blank_if_none(entry["matched_count_validated"]),
+        "invalid_quote_count": _blank_if_none(entry["invalid_quote_count"]),
+        "evidence_prompt_includes_description": _blank_if_none(entry["evidence_prompt_includes_description"]),
+        "scoring_rationale": entry["scoring_rationale"],
+        "criteria_used": json.dumps(entry["criteria_used"], default=str),
+        "gap_details": json.dumps(entry["gap_details"], default=str),
+    }
 
 
 def audit_log(
@@ -193,7 +424,7 @@ def audit_log(
     error: str | None = None,
     extra: dict | None = None,
 ):
-    """Append a structured audit entry to the audit log (JSONL)."""
+    """Queue a structured audit entry for append to the audit log (JSONL)."""
     _ensure_log_dir()
     entry = {
         "timestamp": _iso_ts(),
@@ -216,8 +447,24 @@ def audit_log(
     if extra:
         entry.update(extra)
 
-    with open(AUDIT_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry, default=str) + "\n")
+    _submit("audit", entry)
+
+
+class _AppLogHandler(logging.Handler):
+    """
+    Writes app.log through _append, so every process (gunicorn workers, PDF pool workers)
+    rotates it under the same file lock and none keeps writing to a rotated-away file.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            data = (self.format(record) + "\n").encode("utf-8")
+            with _write_lock:
+                segment = _append(APP_LOG_FILE, data, max_bytes=APP_LOG_MAX_BYTES)
+            if segment is not None:
+                _compress_segment(segment, APP_LOG_BACKUP_COUNT)
+        except Exception:
+            self.handleError(record)
 
 
 def setup_app_logging():
@@ -237,8 +484,8 @@ def setup_app_logging():
     ch.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
     logger.addHandler(ch)
 
-    # File
-    fh = logging.FileHandler(APP_LOG_FILE, encoding="utf-8")
+    # File (rotated by size; rotated segments are gzipped)
+    fh = _AppLogHandler()
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(logging.Formatter(fmt, datefmt=datefmt))
     logger.addHandler(fh)
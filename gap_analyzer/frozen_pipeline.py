@@ -1,9 +1,11 @@
 """Orchestrates the deterministic frozen-requirements pipeline for /api/analyze."""
 
-import json
-
 from src.utils import hash_text
-from src.pipeline.artifacts import load_requirements_artifact_by_jd_hash, save_evidence_artifact
+from src.pipeline.artifacts import (
+    load_requirements_artifact_by_jd_hash,
+    requirements_hash_by_jd_hash,
+    save_evidence_artifact,
+)
 from src.pipeline.match import match_resume_to_requirements
 from src.scoring import compute_score
 from src.validation import validate_evidence_map as validate_evidence_map_schema
@@ -11,32 +13,20 @@ from src.validation import validate_evidence_map as validate_evidence_map_schema
 
 def _evidence_map_to_gap_report(requirements_doc: dict, evidence_map: dict) -> list[dict]:
     """Convert evidence map + requirements to UI gap_report format (status, evidence, etc)."""
-    req_by_id = {r["id"]: r for r in requirements_doc.get("requirements", [])}
     match_by_id = {m["requirement_id"]: m for m in evidence_map.get("matches", [])}
-    report = []
-    for r in requirements_doc.get("requirements", []):
-        m = match_by_id.get(r["id"], {})
-        matched = m.get("matched", False)
-        evidence_list = m.get("evidence") or []
-        evidence_str = (
-            evidence_list[0]["quote"] if evidence_list and evidence_list[0].get("quote") else "No evidence found."
-        )
-        if matched:
-            status = "MATCH"
-        elif r.get("must_have"):
-            status = "MISSING"
-        else:
-            status = "GAP"
-        report.append({
+    return [
+        {
             "id": r["id"],
             "category": r.get("category", "Technical"),
             "name": r.get("name", ""),
             "description": r.get("description", ""),
             "importance": "Must-have" if r.get("must_have") else "Nice-to-have",
-            "status": status,
-            "evidence": evidence_str,
-        })
-    return report
+            "status": "MATCH" if m.get("matched") else "MISSING" if r.get("must_have") else "GAP",
+            "evidence": (m.get("evidence") or [{}])[0].get("quote") or "No evidence found.",
+        }
+        for r in requirements_doc.get("requirements", [])
+        for m in (match_by_id.get(r["id"], {}),)
+    ]
 
 
 def run_frozen_analysis(
@@ -53,7 +43,7 @@ def run_frozen_analysis(
     resume_hash = hash_text(resume_text)
 
     requirements_doc, artifact_path = load_requirements_artifact_by_jd_hash(jd_hash)
-    evidence_map = match_resume_to_requirements(api_key, resume_text, requirements_doc)
+    evidence_map = match_resume_to_requirements(api_key, resume_text, requirements_doc, resume_hash)
     validate_evidence_map_schema(evidence_map)
     # Save without _audit for clean artifact
     to_save = {k: v for k, v in evidence_map.items() if k not in ("_audit", "meta")}
@@ -95,7 +85,7 @@ def run_frozen_analysis(
 
     audit_info = evidence_map.get("_audit", {})
     meta = evidence_map.get("meta", {})
-    requirements_hash = hash_text(json.dumps(requirements_doc, sort_keys=True))
+    requirements_hash = requirements_hash_by_jd_hash(jd_hash)
 
     return {
         "model_id": evidence_map.get("model_id"),  # actual model used (match stage)
@@ -1,18 +1,50 @@
 """PDF generation for tailored résumés based on gap analysis."""
 
+from collections.abc import Iterator
 from pathlib import Path
+from typing import BinaryIO
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 
+# Styles are built once; Paragraph only reads them.
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_STYLES["Heading1"],
+    fontSize=18,
+    spaceAfter=12,
+    alignment=TA_CENTER,
+)
+_HEADING_STYLE = ParagraphStyle(
+    "CustomHeading",
+    parent=_STYLES["Heading2"],
+    fontSize=12,
+    spaceBefore=12,
+    spaceAfter=6,
+)
+_BODY_STYLE = _STYLES["Normal"]
+
+
+def _paragraphs(text: str, style: ParagraphStyle) -> Iterator[Paragraph]:
+    """One Paragraph per blank-line-separated block, preserving line breaks."""
+    for block in text.split("\n\n"):
+        if block.strip():
+            yield Paragraph(block.replace("\n", "<br/>"), style)
+
 
 class ResumePDFGenerator:
     """Generates tailored résumé PDFs based on gap analysis recommendations."""
 
-    def __init__(self, output_path: str | Path):
-        self.output_path = Path(output_path)
+    def __init__(self, output_path: str | Path | BinaryIO):
+        """
+        Args:
+            output_path: File path for the PDF, or a writable binary buffer (e.g. BytesIO)
+                to build it in memory.
+        """
+        self.output_path = output_path if hasattr(output_path, "write") else Path(output_path)
 
     def generate_from_analysis(
         self,
@@ -20,7 +52,7 @@ class ResumePDFGenerator:
         gap_analysis: str | dict,
         recommendations_section: bool = True,
         keywords_section: bool = True,
-    ) -> Path:
+    ) -> Path | BinaryIO:
         """
         Generate a PDF résumé with suggestions based on gap analysis.
 
@@ -31,33 +63,21 @@ class ResumePDFGenerator:
             keywords_section: Whether to add "Keywords to Add" section.
 
         Returns:
-            Path to the generated PDF file.
+            The output path (or buffer) the PDF was written to.
         """
         doc = SimpleDocTemplate(
-            str(self.output_path),
+            self.output_path if hasattr(self.output_path, "write") else str(self.output_path),
             pagesize=letter,
             rightMargin=inch,
             leftMargin=inch,
             topMargin=inch,
             bottomMargin=inch,
+            pageCompression=1,
         )
 
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=18,
-            spaceAfter=12,
-            alignment=TA_CENTER,
-        )
-        heading_style = ParagraphStyle(
-            "CustomHeading",
-            parent=styles["Heading2"],
-            fontSize=12,
-            spaceBefore=12,
-            spaceAfter=6,
-        )
-        body_style = styles["Normal"]
+        title_style = _TITLE_STYLE
+        heading_style = _HEADING_STYLE
+        body_style = _BODY_STYLE
 
         story = []
 
@@ -67,9 +87,7 @@ class ResumePDFGenerator:
 
         # Original résumé content (preserve line breaks)
         story.append(Paragraph("Original Content", heading_style))
-        for block in original_resume_text.split("\n\n"):
-            if block.strip():
-                story.append(Paragraph(block.replace("\n", "<br/>"), body_style))
+        story.extend(_paragraphs(original_resume_text, body_style))
         story.append(Spacer(1, 0.3 * inch))
 
         if recommendations_section or keywords_section:
@@ -98,9 +116,7 @@ class ResumePDFGenerator:
                 )
         elif isinstance(gap_analysis, str) and recommendations_section:
             story.append(Paragraph("Full Analysis", heading_style))
-            for block in gap_analysis.split("\n\n"):
-                if block.strip():
-                    story.append(Paragraph(block.replace("\n", "<br/>"), body_style))
+            story.extend(_paragraphs(gap_analysis, body_style))
 
         doc.build(story)
         return self.output_path
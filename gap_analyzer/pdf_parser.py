@@ -1,7 +1,174 @@
 """PDF parsing utilities for extracting text from résumés."""
 
+import hashlib
+import multiprocessing
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from io import BytesIO, StringIO
 from pathlib import Path
-from pypdf import PdfReader
+from typing import TYPE_CHECKING, BinaryIO
+
+from src.utils import atomic_write_text
+
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
+# PyMuPDF (MuPDF, C) extracts text several times faster than pure-Python pypdf, but its text
+# differs (bullets, line breaks), which changes resume hashes and quote validation. It is also
+# AGPL-licensed, so it is opt-in: PDF_BACKEND=pymupdf (requires `pip install pymupdf`).
+PDF_BACKEND = os.environ.get("PDF_BACKEND", "pypdf")
+
+# On-disk cache of extracted PDF text (see extract_text_from_pdf_cached).
+TEXT_CACHE_DIR = Path(os.environ.get("GAP_ANALYZER_CACHE_DIR") or Path.home() / ".cache" / "gap_analyzer")
+
+# PDFs are parsed in one shared pool of worker processes: large uploads (extract_text_in_pool)
+# and the page ranges of long PDFs. pypdf is pure Python, so threads would serialize on the GIL
+# (and race on the reader's shared stream). Each web worker process gets its own pool, so it is
+# kept small (PDF_POOL_WORKERS); uploads under PDF_INLINE_MAX_BYTES skip the process round trip.
+PARALLEL_MIN_PAGES = 16
+PDF_POOL_WORKERS = max(1, int(os.environ.get("PDF_POOL_WORKERS", "2")))
+PDF_INLINE_MAX_BYTES = int(os.environ.get("PDF_INLINE_MAX_BYTES", str(256 * 1024)))
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # Workers come from a forkserver rather than being forked from a threaded server
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver") if "forkserver" in methods else None
+            _POOL = ProcessPoolExecutor(max_workers=PDF_POOL_WORKERS, mp_context=ctx)
+        return _POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool (a worker died, e.g. OOM) so the next call builds a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_pool(fn, *args):
+    """fn(*args) in the pool; after a worker crash, retried once on a fresh pool."""
+    for attempt in range(2):
+        pool = _pool()
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            if attempt:
+                raise
+
+
+def _iter_text(reader: "PdfReader", start: int = 0, stop: int | None = None) -> Iterator[str]:
+    stop = len(reader.pages) if stop is None else stop
+    for i in range(start, stop):
+        page_text = reader.pages[i].extract_text()
+        if page_text:
+            yield page_text
+
+
+def _join(texts: Iterable[str]) -> str:
+    buf = StringIO()
+    for i, page_text in enumerate(texts):
+        if i:
+            buf.write("\n\n")
+        buf.write(page_text)
+    return buf.getvalue().strip()
+
+
+def _page_range_text(source: str | bytes, start: int, stop: int) -> list[str]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(BytesIO(source) if isinstance(source, bytes) else source)
+    return list(_iter_text(reader, start, stop))
+
+
+def _use_pymupdf() -> bool:
+    return PDF_BACKEND == "pymupdf"
+
+
+@lru_cache(maxsize=None)
+def _parser_id() -> str:
+    """Backend and its installed version; part of the text cache key."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    backend = "pymupdf" if _use_pymupdf() else "pypdf"
+    try:
+        return f"{backend}-{version(backend)}"
+    except PackageNotFoundError:
+        return backend
+
+
+def _pymupdf_pages(source: str | bytes) -> list[str]:
+    import pymupdf
+
+    doc = pymupdf.open(stream=source, filetype="pdf") if isinstance(source, bytes) else pymupdf.open(source)
+    with doc:
+        return [text for text in (page.get_text("text") for page in doc) if text]
+
+
+def _extract_text(source: str | bytes) -> str:
+    """Extract text from a PDF path or bytes; page ranges run in parallel for long documents."""
+    if _use_pymupdf():
+        return _join(_pymupdf_pages(source))
+    from pypdf import PdfReader
+
+    reader = PdfReader(BytesIO(source) if isinstance(source, bytes) else source)
+    num_pages = len(reader.pages)
+    workers = PDF_POOL_WORKERS
+    # Stay sequential for short PDFs, a single-worker pool, and when already inside a worker process
+    if num_pages < PARALLEL_MIN_PAGES or workers < 2 or multiprocessing.parent_process() is not None:
+        return _join(_iter_text(reader))
+    step = -(-num_pages // workers)
+    pool = _pool()
+    try:
+        futures = [
+            pool.submit(_page_range_text, source, start, min(num_pages, start + step))
+            for start in range(0, num_pages, step)
+        ]
+        return _join(text for future in futures for text in future.result())
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        return _join(_iter_text(reader))
+
+
+def iter_pages_text(pdf_path: str | Path) -> Iterator[str]:
+    """
+    Yield the text of each non-empty page of a PDF, in order.
+
+    Pages are extracted lazily, so callers that only need the opening of a résumé
+    (e.g. the header) can stop early without parsing the rest.
+    """
+    path = Path(pdf_path)
+    if not path.exists():
+        raise FileNotFoundError(f"PDF not found: {path}")
+    if _use_pymupdf():
+        import pymupdf
+
+        with pymupdf.open(path) as doc:
+            for page in doc:
+                page_text = page.get_text("text")
+                if page_text:
+                    yield page_text
+        return
+    from pypdf import PdfReader
+
+    yield from _iter_text(PdfReader(path))
+
+
+@lru_cache(maxsize=16)
+def _extract_text_cached(path: str, mtime_ns: int, size: int, pymupdf: bool) -> str:
+    """_extract_text memoized per file version (mtime/size) and backend; the key args are not read."""
+    return _extract_text(path)
 
 
 def extract_text_from_pdf(pdf_path: str | Path) -> str:
@@ -22,12 +189,53 @@ def extract_text_from_pdf(pdf_path: str | Path) -> str:
     if not path.exists():
         raise FileNotFoundError(f"PDF not found: {path}")
 
-    reader = PdfReader(path)
-    text_parts = []
+    # Repeat extractions of an unchanged file (tests, repeat pipeline runs) are served from memory
+    st = path.stat()
+    return _extract_text_cached(str(path.resolve()), st.st_mtime_ns, st.st_size, _use_pymupdf())
 
-    for page in reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            text_parts.append(page_text)
 
-    return "\n\n".join(text_parts).strip()
+def extract_text_from_pdf_bytes(data: bytes | BinaryIO) -> str:
+    """
+    Extract text from an in-memory PDF (e.g., an uploaded résumé) without a temp file.
+
+    Args:
+        data: Raw PDF bytes or a binary file-like object.
+
+    Returns:
+        Extracted text content, as for extract_text_from_pdf.
+    """
+    raw = bytes(data) if isinstance(data, (bytes, bytearray, memoryview)) else data.read()
+    return _extract_text(raw)
+
+
+def extract_text_from_pdf_cached(pdf_path: str | Path) -> str:
+    """
+    extract_text_from_pdf backed by an on-disk cache under TEXT_CACHE_DIR.
+
+    Entries are keyed on sha256 of the file bytes plus the backend and its version, so
+    re-evaluating a résumé skips parsing while a backend or parser upgrade forces a re-parse.
+    """
+    raw = Path(pdf_path).read_bytes()
+    key = hashlib.sha256(raw + b"\x00" + _parser_id().encode("utf-8")).hexdigest()
+    cached = TEXT_CACHE_DIR / f"resume_text_{key}.txt"
+    try:
+        return cached.read_text(encoding="utf-8")
+    except OSError:
+        pass
+    text = _extract_text(raw)
+    try:
+        atomic_write_text(cached, text)
+    except OSError:
+        pass  # cache is best-effort
+    return text
+
+
+def extract_text_in_pool(data: bytes) -> str:
+    """
+    extract_text_from_pdf_bytes in a worker process, so a threaded server does not serialize
+    large uploads on the GIL. Uploads under PDF_INLINE_MAX_BYTES are parsed inline. The shared
+    pool is rebuilt if a worker crashes.
+    """
+    if len(data) < PDF_INLINE_MAX_BYTES:
+        return extract_text_from_pdf_bytes(data)
+    return _run_in_pool(extract_text_from_pdf_bytes, data)
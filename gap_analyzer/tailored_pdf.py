@@ -1,203 +1,311 @@
 """PDF generation for tailored résumés - professional formatting."""
 
 import re
+from functools import lru_cache
 from io import BytesIO
+from typing import BinaryIO
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase.pdfmetrics import getFont, stringWidth
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
 from reportlab.lib.colors import black, HexColor
 
+# Markdown patterns, compiled once (applied to every line of every résumé).
+# _RE_MD strips a leading # run (e.g. ##### or ##), ** markers, and [text](url) links in one pass.
+_RE_MD = re.compile(r"^#+\s*|\*\*|\[(.*?)\]\([^)]*\)")
+_RE_HR = re.compile(r"^(={3,}|-{3,})$")
+_RE_KV = re.compile(r"^\*\*(.*?)\*\*:(.*)")
 
+
+@lru_cache(maxsize=1024)
 def _clean_text(text: str) -> str:
-    """Strip markdown markers for PDF (no hash symbols, bold, or links)."""
-    text = re.sub(r"^#+\s*", "", text)  # strip leading # (e.g. ##### or ##)
-    text = re.sub(r"\*\*", "", text)
-    text = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", text)
-    return text.strip()
+    """
+    Strip markdown markers for PDF (no hash symbols, bold, or links).
+    Memoized: refined drafts re-render mostly unchanged lines.
+    """
+    if not ("#" in text or "*" in text or "[" in text):
+        return text.strip()
+    return _RE_MD.sub(_md_replacement, text).strip()
+
+
+def _md_replacement(m: re.Match) -> str:
+    # Link text keeps its words but not its bold markers
+    return m.group(1).replace("**", "") if m.group(1) else ""
+
+
+@lru_cache(maxsize=None)
+def _ascii_widths(font: str) -> tuple[int, ...]:
+    """Glyph widths (1/1000 em) of a standard font for codes 0-127; WinAnsi matches printable ASCII."""
+    return tuple(getFont(font).widths[:128])
+
+
+def _text_units(text: str, font: str) -> int:
+    """
+    Width in integer glyph units (1/1000 em), summed from the ASCII width table when the text
+    is printable ASCII, so widths add up without float drift.
+    """
+    if text.isascii() and text.isprintable():
+        return sum(map(_ascii_widths(font).__getitem__, text.encode("ascii")))
+    # Standard-font glyph widths are integers; at size 1000 the scaled sum is the unit count
+    return round(stringWidth(text, font, 1000))
+
+
+# Width of one word in glyph units; résumés repeat the same words across bullets
+_word_units = lru_cache(maxsize=4096)(_text_units)
+
 
+def _text_width(text: str, font: str, size: int) -> float:
+    """stringWidth via _text_units: same arithmetic as ReportLab's Type 1 stringWidth (integer sum, then scale)."""
+    return _text_units(text, font) * 0.001 * size
 
-def _is_category_label(line: str) -> bool:
-    """Detect short ALL-CAPS lines like LANGUAGES, FRAMEWORKS & PLATFORMS."""
-    cleaned = _clean_text(line)
+
+def _is_category_label(cleaned: str) -> bool:
+    """Detect short ALL-CAPS lines like LANGUAGES, FRAMEWORKS & PLATFORMS (text already _clean_text'ed)."""
     if len(cleaned) > 60 or not cleaned:
         return False
-    letters = sum(1 for c in cleaned if c.isalpha())
-    caps = sum(1 for c in cleaned if c.isupper())
+    # map() keeps the per-character tests in C (and Unicode-aware, e.g. "É")
+    letters = sum(map(str.isalpha, cleaned))
+    caps = sum(map(str.isupper, cleaned))
     return letters > 0 and caps / letters >= 0.7
 
 
+PAGE_WIDTH, PAGE_HEIGHT = letter
+MARGIN = 0.75 * inch
+CONTENT_WIDTH = PAGE_WIDTH - (MARGIN * 2)
+
+LINE_HEIGHT = 14
+BULLET_INDENT = 16
+SECTION_SPACING = 20
+MAJOR_SECTION_SPACING = 28
+
+TEXT_DARK = HexColor("#1e293b")
+TEXT_BODY = HexColor("#334155")
+
+
+def _split_lines(text: str, font: str, size: int, max_width: float) -> list[str]:
+    """
+    Wrap text to fit width (running line width; each word measured once). Widths are summed in
+    integer glyph units and scaled once per check, exactly as stringWidth measures the joined line.
+    """
+    words = text.split()
+    joined = " ".join(words)
+    # Most lines fit: one measurement, no per-word loop
+    if _text_width(joined, font, size) <= max_width:
+        return [joined] if joined else [text]
+    space_u = _word_units(" ", font)
+    lines = []
+    current = []
+    current_u = 0
+    for w in words:
+        wu = _word_units(w, font)
+        if current and (current_u + space_u + wu) * 0.001 * size > max_width:
+            lines.append(" ".join(current))
+            current = [w]
+            current_u = wu
+        else:
+            current_u += wu + space_u if current else wu
+            current.append(w)
+    if current:
+        lines.append(" ".join(current))
+    return lines if lines else [text]
+
+
+class _TailoredPDFWriter:
+    """Canvas plus layout state (cursor, last font/fill) for rendering one tailored résumé."""
+
+    __slots__ = ("doc", "cursor_y", "font", "fill")
+
+    def __init__(self, out: BinaryIO):
+        # Compress page streams regardless of site-wide rl_config (several-fold smaller downloads)
+        self.doc = canvas.Canvas(out, pagesize=letter, pageCompression=1)
+        self.cursor_y = PAGE_HEIGHT - MARGIN
+        # Font/fill last sent to the canvas; unchanged state is not re-emitted into the page stream
+        self.font: tuple[str, int] | None = None
+        self.fill = None
+
+    def set_font(self, name: str, size: int) -> None:
+        if self.font != (name, size):
+            self.doc.setFont(name, size)
+            self.font = (name, size)
+
+    def set_fill(self, color) -> None:
+        if self.fill is not color:
+            self.doc.setFillColor(color)
+            self.fill = color
+
+    def new_page(self) -> None:
+        self.doc.showPage()
+        self.cursor_y = PAGE_HEIGHT - MARGIN
+        # showPage resets the canvas graphics state
+        self.font = self.fill = None
+
+    def render(self, tailored_text: str) -> None:
+        lines = [stripped for stripped in map(str.strip, tailored_text.split("\n")) if stripped]
+
+        for line in lines:
+            # Classify on the leading character: headings by their # run, rules by = / -
+            first = line[0]
+            if first == "#":
+                hashes = len(line) - len(line.lstrip("#"))
+                after = line[hashes:hashes + 1]
+                if hashes <= 3 and after == " ":
+                    _HEADINGS[hashes](self, line)
+                    continue
+                if hashes >= 4 and after.isspace():
+                    self.sub_header(line)
+                    continue
+            elif first in "=-" and _RE_HR.match(line):
+                continue
+
+            cleaned = _clean_text(line)
+            if _is_category_label(cleaned):
+                self.category_label(cleaned)
+            elif line.upper() in ("IMPACT", "IMPACT:"):
+                self.impact()
+            elif first in "-*" and line[1:2] == " ":
+                self.bullet(line)
+            elif first == "*" and (m := _RE_KV.match(line)):
+                self.key_value(m)
+            else:
+                self.body(cleaned)
+
+        self.doc.save()
+
+    # 1. NAME / H1 (# )
+    def h1(self, line: str) -> None:
+        doc = self.doc
+        if self.cursor_y - 50 < MARGIN:
+            self.new_page()
+        text = _clean_text(line[2:])
+        self.set_font("Helvetica-Bold", 26)
+        self.set_fill(black)
+        doc.drawCentredString(PAGE_WIDTH / 2, self.cursor_y, text[:80])
+        y = self.cursor_y - (LINE_HEIGHT + 8)
+        doc.setStrokeColor(black)
+        doc.setLineWidth(0.4)
+        doc.line(MARGIN, y, PAGE_WIDTH - MARGIN, y)
+        self.cursor_y = y - MAJOR_SECTION_SPACING
+
+    # 2. MAJOR SECTION (## ) - Contact, Summary, Core Skills, etc.
+    def h2(self, line: str) -> None:
+        self._section_header(_clean_text(line[3:]).upper(), 45, 12, 0.5)
+
+    # 3. SECTION HEADER (### )
+    def h3(self, line: str) -> None:
+        self._section_header(_clean_text(line[4:]).upper(), 40, 11, 0.4)
+
+    def _section_header(self, header_text: str, needed_height: float, size: int, rule_width: float) -> None:
+        doc = self.doc
+        if self.cursor_y - needed_height < MARGIN:
+            self.new_page()
+        y = self.cursor_y - 6
+        self.set_font("Helvetica-Bold", size)
+        self.set_fill(black)
+        doc.drawString(MARGIN, y, header_text[:120])
+        y -= 4
+        doc.setStrokeColor(black)
+        doc.setLineWidth(rule_width)
+        doc.line(MARGIN, y, PAGE_WIDTH - MARGIN, y)
+        self.cursor_y = y - SECTION_SPACING
+
+    # 4. SUB-HEADER (#### or #####) - job title, role
+    def sub_header(self, line: str) -> None:
+        if self.cursor_y - 28 < MARGIN:
+            self.new_page()
+        y = self.cursor_y - 4
+        self.set_font("Helvetica-Bold", 11)
+        self.set_fill(TEXT_DARK)
+        self.doc.drawString(MARGIN, y, _clean_text(line)[:120])
+        self.cursor_y = y - (LINE_HEIGHT + 4)
+
+    # 5. CATEGORY LABEL (LANGUAGES, FRAMEWORKS & PLATFORMS, etc.)
+    def category_label(self, cleaned: str) -> None:
+        if self.cursor_y - 24 < MARGIN:
+            self.new_page()
+        y = self.cursor_y - 4
+        self.set_font("Helvetica-Bold", 10)
+        self.set_fill(TEXT_DARK)
+        self.doc.drawString(MARGIN, y, cleaned[:80])
+        self.cursor_y = y - (LINE_HEIGHT + 2)
+
+    # 6. IMPACT / small sub-heading
+    def impact(self) -> None:
+        if self.cursor_y - 24 < MARGIN:
+            self.new_page()
+        y = self.cursor_y - 6
+        self.set_font("Helvetica-Bold", 10)
+        self.set_fill(TEXT_DARK)
+        self.doc.drawString(MARGIN, y, "Impact")
+        self.cursor_y = y - (LINE_HEIGHT + 2)
+
+    # 7. BULLET (- or *)
+    def bullet(self, line: str) -> None:
+        doc = self.doc
+        wrapped = _split_lines(_clean_text(line[2:]), "Helvetica", 10, CONTENT_WIDTH - BULLET_INDENT)
+        if self.cursor_y - (len(wrapped) * LINE_HEIGHT + 6) < MARGIN:
+            self.new_page()
+        self.set_font("Helvetica", 10)
+        self.set_fill(black)
+        doc.drawString(MARGIN + 4, self.cursor_y, "•")
+        self.set_fill(TEXT_BODY)
+        self._draw_lines(MARGIN + BULLET_INDENT, wrapped, 150)
+        self.cursor_y -= 3
+
+    # 8. KEY-VALUE (**key**: value)
+    def key_value(self, m: re.Match) -> None:
+        doc = self.doc
+        key = m.group(1) + ":"
+        val = _clean_text(m.group(2))
+        self.set_font("Helvetica-Bold", 10)
+        self.set_fill(TEXT_DARK)
+        kw = doc.stringWidth(key, "Helvetica-Bold", 10)
+        avail = CONTENT_WIDTH - kw - 4
+        val_lines = _split_lines(val, "Helvetica", 10, avail)
+        if self.cursor_y - (len(val_lines) * LINE_HEIGHT + 4) < MARGIN:
+            self.new_page()
+        doc.drawString(MARGIN, self.cursor_y, key)
+        self.set_font("Helvetica", 10)
+        self.set_fill(TEXT_BODY)
+        self._draw_lines(MARGIN + kw + 4, val_lines, 120)
+        self.cursor_y -= 4
+
+    # 9. BODY TEXT
+    def body(self, cleaned: str) -> None:
+        self.set_font("Helvetica", 10)
+        self.set_fill(TEXT_BODY)
+        remaining = _split_lines(cleaned, "Helvetica", 10, CONTENT_WIDTH)
+        while remaining:
+            if self.cursor_y - LINE_HEIGHT < MARGIN:
+                self.new_page()
+            # Lines that fit above the bottom margin go out as one text object
+            fit = int((self.cursor_y - MARGIN) // LINE_HEIGHT)
+            self._draw_lines(MARGIN, remaining[:fit], 150)
+            remaining = remaining[fit:]
+        self.cursor_y -= 4
+
+    def _draw_lines(self, x: float, lines: list[str], max_chars: int) -> None:
+        """Draw lines downward from cursor_y in a single BT/ET text object; advances cursor_y."""
+        text = self.doc.beginText(x, self.cursor_y)
+        text.setLeading(LINE_HEIGHT)
+        for w in lines:
+            text.textLine(w[:max_chars])
+        self.doc.drawText(text)
+        self.cursor_y -= len(lines) * LINE_HEIGHT
+
+
+_HEADINGS = {1: _TailoredPDFWriter.h1, 2: _TailoredPDFWriter.h2, 3: _TailoredPDFWriter.h3}
+
+
 def generate_tailored_pdf(tailored_text: str, candidate_name: str = "Candidate") -> bytes:
     """
     Generate PDF from markdown-formatted tailored resume.
     Professional layout: generous spacing, clear hierarchy.
     """
     buffer = BytesIO()
-    doc = canvas.Canvas(buffer, pagesize=letter)
-    page_width, page_height = letter
-    margin = 0.75 * inch
-    content_width = page_width - (margin * 2)
-    cursor_y = page_height - margin
-
-    LINE_HEIGHT = 14
-    BULLET_INDENT = 16
-    SECTION_SPACING = 20
-    MAJOR_SECTION_SPACING = 28
-
-    def check_page_break(needed_height: float = 20) -> None:
-        nonlocal cursor_y
-        if cursor_y - needed_height < margin:
-            doc.showPage()
-            cursor_y = page_height - margin
-
-    def split_lines(text: str, font: str, size: int, max_width: float) -> list[str]:
-        """Wrap text to fit width."""
-        words = text.split()
-        lines = []
-        current = []
-        for w in words:
-            test = " ".join(current + [w])
-            if doc.stringWidth(test, font, size) <= max_width:
-                current.append(w)
-            else:
-                if current:
-                    lines.append(" ".join(current))
-                current = [w]
-        if current:
-            lines.append(" ".join(current))
-        return lines if lines else [text]
-
-    text_dark = HexColor("#1e293b")
-    text_body = HexColor("#334155")
-
-    lines = tailored_text.split("\n")
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if re.match(r"^={3,}$", line) or re.match(r"^-{3,}$", line):
-            continue
-
-        # 1. NAME / H1 (# )
-        if line.startswith("# "):
-            check_page_break(50)
-            text = _clean_text(line[2:])
-            doc.setFont("Helvetica-Bold", 26)
-            doc.setFillColor(black)
-            tw = doc.stringWidth(text, "Helvetica-Bold", 26)
-            x = (page_width - tw) / 2
-            doc.drawString(x, cursor_y, text[:80])
-            cursor_y -= LINE_HEIGHT + 8
-            doc.setStrokeColor(black)
-            doc.setLineWidth(0.4)
-            doc.line(margin, cursor_y, page_width - margin, cursor_y)
-            cursor_y -= MAJOR_SECTION_SPACING
-
-        # 2. MAJOR SECTION (## ) - Contact, Summary, Core Skills, etc.
-        elif line.startswith("## "):
-            check_page_break(45)
-            cursor_y -= 6
-            header_text = _clean_text(line[3:]).upper()
-            doc.setFont("Helvetica-Bold", 12)
-            doc.setFillColor(black)
-            doc.drawString(margin, cursor_y, header_text[:120])
-            cursor_y -= 4
-            doc.setStrokeColor(black)
-            doc.setLineWidth(0.5)
-            doc.line(margin, cursor_y, page_width - margin, cursor_y)
-            cursor_y -= SECTION_SPACING
-
-        # 3. SECTION HEADER (### )
-        elif line.startswith("### "):
-            check_page_break(40)
-            cursor_y -= 6
-            header_text = _clean_text(line[4:]).upper()
-            doc.setFont("Helvetica-Bold", 11)
-            doc.setFillColor(black)
-            doc.drawString(margin, cursor_y, header_text[:120])
-            cursor_y -= 4
-            doc.setStrokeColor(black)
-            doc.setLineWidth(0.4)
-            doc.line(margin, cursor_y, page_width - margin, cursor_y)
-            cursor_y -= SECTION_SPACING
-
-        # 4. SUB-HEADER (#### or #####) - job title, role
-        elif re.match(r"^#{4,}\s", line):
-            check_page_break(28)
-            cursor_y -= 4
-            doc.setFont("Helvetica-Bold", 11)
-            doc.setFillColor(text_dark)
-            doc.drawString(margin, cursor_y, _clean_text(line)[:120])
-            cursor_y -= LINE_HEIGHT + 4
-
-        # 5. CATEGORY LABEL (LANGUAGES, FRAMEWORKS & PLATFORMS, etc.)
-        elif _is_category_label(line):
-            check_page_break(24)
-            cursor_y -= 4
-            doc.setFont("Helvetica-Bold", 10)
-            doc.setFillColor(text_dark)
-            doc.drawString(margin, cursor_y, _clean_text(line)[:80])
-            cursor_y -= LINE_HEIGHT + 2
-
-        # 6. IMPACT / small sub-heading
-        elif line.upper() in ("IMPACT", "IMPACT:"):
-            check_page_break(24)
-            cursor_y -= 6
-            doc.setFont("Helvetica-Bold", 10)
-            doc.setFillColor(text_dark)
-            doc.drawString(margin, cursor_y, "Impact")
-            cursor_y -= LINE_HEIGHT + 2
-
-        # 7. BULLET (- or *)
-        elif line.startswith("- ") or line.startswith("* "):
-            bullet_text = _clean_text(line[2:])
-            wrapped = split_lines(bullet_text, "Helvetica", 10, content_width - BULLET_INDENT)
-            check_page_break(len(wrapped) * LINE_HEIGHT + 6)
-            doc.setFont("Helvetica", 10)
-            doc.setFillColor(black)
-            doc.drawString(margin + 4, cursor_y, "•")
-            doc.setFillColor(text_body)
-            for w in wrapped:
-                doc.drawString(margin + BULLET_INDENT, cursor_y, w[:150])
-                cursor_y -= LINE_HEIGHT
-            cursor_y -= 3
-
-        # 8. KEY-VALUE (**key**: value)
-        elif re.match(r"^\*\*.*?\*\*:", line):
-            m = re.match(r"^\*\*(.*?)\*\*:(.*)", line)
-            if m:
-                key = m.group(1) + ":"
-                val = _clean_text(m.group(2))
-                doc.setFont("Helvetica-Bold", 10)
-                doc.setFillColor(text_dark)
-                kw = doc.stringWidth(key, "Helvetica-Bold", 10)
-                avail = content_width - kw - 4
-                val_lines = split_lines(val, "Helvetica", 10, avail)
-                check_page_break(len(val_lines) * LINE_HEIGHT + 4)
-                doc.drawString(margin, cursor_y, key)
-                doc.setFont("Helvetica", 10)
-                doc.setFillColor(text_body)
-                for w in val_lines:
-                    doc.drawString(margin + kw + 4, cursor_y, w[:120])
-                    cursor_y -= LINE_HEIGHT
-                cursor_y -= 4
-            else:
-                doc.setFont("Helvetica", 10)
-                doc.setFillColor(text_body)
-                for w in split_lines(_clean_text(line), "Helvetica", 10, content_width):
-                    check_page_break(LINE_HEIGHT)
-                    doc.drawString(margin, cursor_y, w[:150])
-                    cursor_y -= LINE_HEIGHT
-                cursor_y -= 4
-        else:
-            doc.setFont("Helvetica", 10)
-            doc.setFillColor(text_body)
-            for w in split_lines(_clean_text(line), "Helvetica", 10, content_width):
-                check_page_break(LINE_HEIGHT)
-                doc.drawString(margin, cursor_y, w[:150])
-                cursor_y -= LINE_HEIGHT
-            cursor_y -= 4
-
-    doc.save()
-    buffer.seek(0)
+    generate_tailored_pdf_to(buffer, tailored_text, candidate_name)
     return buffer.getvalue()
+
+
+def generate_tailored_pdf_to(out: BinaryIO, tailored_text: str, candidate_name: str = "Candidate") -> None:
+    """Render the tailored resume PDF straight into a writable binary file (no intermediate buffer)."""
+    _TailoredPDFWriter(out).render(tailored_text)
@@ -3,9 +3,15 @@
 import json
 import os
 import re
-from groq import Groq
+import threading
+
+from src.pipeline import llm, llm_cache
 
 MODEL = os.environ.get("GROQ_MODEL", "llama-3.3-70b-versatile")  # Exported for audit logging
+# Cap in-flight Groq calls across request threads (size to account RPM / 60); the SDK
+# retries 429/5xx with exponential backoff and honors Retry-After.
+GROQ_CONCURRENCY = int(os.environ.get("GROQ_CONCURRENCY", "8"))
+_GROQ_SEM = threading.BoundedSemaphore(GROQ_CONCURRENCY)
 
 # --- MOCK DATA (matches React MOCK_JD_RESPONSE, MOCK_RESUME_RESPONSE) ---
 MOCK_JD_RESPONSE = {
@@ -31,8 +37,19 @@ MOCK_RESUME_RESPONSE = {
 
 
 def _call_groq(api_key: str, system_prompt: str, user_text: str, json_mode: bool = True) -> dict:
-    """Call Groq API - matches React callGroq behavior."""
-    client = Groq(api_key=api_key)
+    """Call Groq API - matches React callGroq behavior. Served from llm_cache when GROQ_CACHE_DIR is set."""
+    key = llm_cache.cache_key(MODEL, system_prompt, user_text, str(json_mode))
+    content = llm_cache.get(key)
+    if content is not None:
+        return json.loads(content)
+    content = _groq_request(api_key, system_prompt, user_text, json_mode)
+    result = json.loads(content)
+    llm_cache.put(key, content, MODEL)
+    return result
+
+
+def _groq_request(api_key: str, system_prompt: str, user_text: str, json_mode: bool) -> str:
+    client = llm.get_client(api_key)
     messages = [
         {"role": "system", "content": system_prompt + (" Return strictly valid JSON." if json_mode else "")},
         {"role": "user", "content": user_text},
@@ -45,9 +62,9 @@ def _call_groq(api_key: str, system_prompt: str, user_text: str, json_mode: bool
     if json_mode:
         kwargs["response_format"] = {"type": "json_object"}
 
-    response = client.chat.completions.create(**kwargs)
-    content = response.choices[0].message.content.strip()
-    return json.loads(content)
+    with _GROQ_SEM:
+        response = client.chat.completions.create(**kwargs)
+    return response.choices[0].message.content.strip()
 
 
 def analyze_jd(api_key: str, jd_text: str, use_mock: bool = False) -> dict:
@@ -149,17 +166,18 @@ def perform_gap_analysis(jd_result: dict, resume_result: dict) -> tuple[list[dic
     jd_reqs = jd_result.get("requirements", [])
     resume_signals = resume_result.get("signals", [])
 
+    # Lower-case each signal name once rather than once per requirement
+    signal_names = [(sig["name"].lower(), sig) for sig in resume_signals]
+
     matches = 0
     report = []
 
     for req in jd_reqs:
         req_name = req["name"].lower()
-        match = None
-        for sig in resume_signals:
-            sig_name = sig["name"].lower()
-            if sig_name in req_name or req_name in sig_name:
-                match = sig
-                break
+        match = next(
+            (sig for sig_name, sig in signal_names if sig_name in req_name or req_name in sig_name),
+            None,
+        )
 
         if match:
             matches += 1
@@ -6,8 +6,6 @@ import json
 import sys
 from pathlib import Path
 
-from gap_analyzer import extract_text_from_pdf, GapAnalyzer, ResumePDFGenerator
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -55,6 +53,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Heavy imports (pypdf, groq, reportlab) only after argument parsing, and only what this run uses
+    from gap_analyzer import extract_text_from_pdf, GapAnalyzer
+
     # Load job description
     if args.jd_text:
         jd_text = args.jd_text
@@ -80,12 +81,19 @@ def main():
         print("The PDF may be scanned. Consider using OCR.", file=sys.stderr)
 
     # Run analysis
+    structured = args.json or not args.no_pdf
     try:
         analyzer = GapAnalyzer(api_key=args.api_key)
+        if not structured:
+            # Plain-text analysis only: print it as it streams in
+            for delta in analyzer.analyze_stream(jd_text, resume_text):
+                print(delta, end="", flush=True)
+            print()
+            return
         result = analyzer.analyze(
             job_description=jd_text,
             resume_text=resume_text,
-            structured=args.json or not args.no_pdf,
+            structured=structured,
         )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -112,6 +120,8 @@ def main():
 
     # Generate PDF if requested
     if not args.no_pdf:
+        from gap_analyzer import ResumePDFGenerator
+
         try:
             gen = ResumePDFGenerator(args.output)
             gen.generate_from_analysis(resume_text, result)
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Generate standalone fastjsonschema validators for schemas/*.schema.json into src/_validators/.
+
+src/validation.py imports a generated module instead of compiling the schema at startup,
+as long as the schema file's sha256 still matches the one recorded at generation time
+(otherwise it compiles as before). Re-run after editing a schema. Requires fastjsonschema.
+
+Usage: python scripts/gen_validators.py
+"""
+
+import sys
+from pathlib import Path
+
+import fastjsonschema
+
+# Add project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.validation import SCHEMAS_DIR, _load_schema, schema_sha256
+
+OUT_DIR = Path(__file__).resolve().parent.parent / "src" / "_validators"
+SCHEMA_NAMES = ("job_requirements", "evidence_map")
+
+
+def main():
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    (OUT_DIR / "__init__.py").write_text('"""Generated by scripts/gen_validators.py; do not edit."""\n', encoding="utf-8")
+    for name in SCHEMA_NAMES:
+        schema = _load_schema(name)
+        try:
+            code = fastjsonschema.compile_to_code(schema, use_formats=False)
+        except TypeError:  # fastjsonschema < 2.17 has no use_formats
+            code = fastjsonschema.compile_to_code(schema)
+        path = OUT_DIR / f"{name}.py"
+        path.write_text(
+            f"# Generated by scripts/gen_validators.py from {SCHEMAS_DIR.name}/{name}.schema.json; do not edit.\n"
+            f"SCHEMA_SHA256 = {schema_sha256(name)!r}\n\n{code}",
+            encoding="utf-8",
+        )
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,12 +18,16 @@ Compare validated matched_count, score, and invalid_quote_count across runs.
 import argparse
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from gap_analyzer import extract_text_from_pdf_cached
 from src.utils import hash_text
 from src.pipeline.extract import extract_requirements_from_jd
+from src.pipeline import llm_cache
 from src.pipeline.artifacts import save_requirements_artifact, load_requirements_artifact_by_jd_hash
 from gap_analyzer.frozen_pipeline import run_frozen_analysis
 
@@ -31,15 +35,40 @@ DEFAULT_RUNS = 10
 DEFAULT_JD = "sample_jd.txt"
 DEFAULT_RESUME = "resumes/master/Master-Copy-Resume.pdf"
 DEFAULT_MODEL = "llama-3.1-8b-instant"
+MAX_PARALLEL_RUNS = 10
 
 
 def _load_resume_text(resume_path: Path) -> str:
     if resume_path.suffix.lower() == ".pdf":
-        from gap_analyzer.pdf_parser import extract_text_from_pdf
-        return extract_text_from_pdf(resume_path)
+        # Same on-disk text cache as cli_pipeline.py and run_idempotency_check.py
+        return extract_text_from_pdf_cached(resume_path)
     return resume_path.read_text(encoding="utf-8")
 
 
+def _summarize(result: dict) -> dict:
+    # run_frozen_analysis does not expose raw matches; gap_report has id and status
+    # (MATCH/MISSING/GAP), so matched = (status == "MATCH")
+    match_pairs = sorted(
+        (g["id"], g.get("status") == "MATCH")
+        for g in result.get("gap_report", [])
+    )
+    return {
+        "match_score": result["match_score"],
+        "num_requirements": result["num_requirements"],
+        "matched_count_raw": result.get("matched_count_raw"),
+        "matched_count_validated": result.get("matched_count_validated"),
+        "invalid_quote_count": result.get("invalid_quote_count", 0),
+        "requirement_ids": [p[0] for p in match_pairs],
+        "match_pairs": match_pairs,
+        "requirements_hash": result.get("requirements_hash"),
+        "requirements_source": result.get("requirements_source"),
+        "requirements_artifact_path": result.get("requirements_artifact_path"),
+        "requirements_version": result.get("requirements_version"),
+        "jd_hash": result.get("jd_hash"),
+        "resume_hash": result.get("resume_hash"),
+    }
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
@@ -48,6 +77,11 @@ def main():
     parser.add_argument("--model", default=DEFAULT_MODEL, help="Model override (sets GROQ_MATCH_MODEL)")
     args = parser.parse_args()
 
+    if llm_cache.enabled():
+        # Cached replies would make every run identical; this check measures the model itself
+        print("Note: ignoring GROQ_CACHE_DIR; every run calls Groq", file=sys.stderr)
+        del os.environ["GROQ_CACHE_DIR"]
+
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
         print("Error: GROQ_API_KEY required", file=sys.stderr)
@@ -74,45 +108,18 @@ def main():
         load_requirements_artifact_by_jd_hash(jd_hash)
     except FileNotFoundError:
         print("Creating requirements artifact...")
-        doc = extract_requirements_from_jd(api_key, jd_text)
+        doc = extract_requirements_from_jd(api_key, jd_text, jd_hash=jd_hash)
         to_save = {k: v for k, v in doc.items() if k != "_audit"}
         save_requirements_artifact(doc["role_id"], doc["jd_hash"], to_save)
 
     print(f"Running analyze {args.runs} times (model={args.model})...")
-    results = []
-    for i in range(args.runs):
-        result = run_frozen_analysis(api_key, jd_text, resume_text)
-        match_pairs = sorted(
-            (m["requirement_id"], m["matched"])
-            for m in result.get("_evidence_matches", [])
-        )
-        # Get match pairs from gap_report (we don't have direct access to evidence_map here)
-        # run_frozen_analysis returns gap_report; we need requirement_id -> matched
-        # The result doesn't expose raw matches. We need to get them from the pipeline.
-        # run_frozen_analysis calls match + compute_score internally. The gap_report has
-        # id and status (MATCH/MISSING/GAP). So matched = (status == "MATCH")
-        gap_report = result.get("gap_report", [])
-        match_pairs = sorted(
-            (g["id"], g.get("status") == "MATCH")
-            for g in gap_report
-        )
-        results.append({
-            "match_score": result["match_score"],
-            "num_requirements": result["num_requirements"],
-            "matched_count_raw": result.get("matched_count_raw"),
-            "matched_count_validated": result.get("matched_count_validated"),
-            "invalid_quote_count": result.get("invalid_quote_count", 0),
-            "requirement_ids": [p[0] for p in match_pairs],
-            "match_pairs": match_pairs,
-            "requirements_hash": result.get("requirements_hash"),
-            "requirements_source": result.get("requirements_source"),
-            "requirements_artifact_path": result.get("requirements_artifact_path"),
-            "requirements_version": result.get("requirements_version"),
-            "jd_hash": result.get("jd_hash"),
-            "resume_hash": result.get("resume_hash"),
-        })
+    # Runs are independent and network-bound; overlap them (Groq 429s are retried by the client)
+    with ThreadPoolExecutor(max_workers=max(1, min(args.runs, MAX_PARALLEL_RUNS))) as ex:
+        futures = [ex.submit(run_frozen_analysis, api_key, jd_text, resume_text) for _ in range(args.runs)]
+        results = [_summarize(f.result()) for f in futures]
 
     first = results[0]
+    first_ids = Counter(first["requirement_ids"])
     variances = []
 
     for i, r in enumerate(results[1:], start=1):
@@ -124,11 +131,9 @@ def main():
                 ("invalid_quote_count", run_num, f"{r['invalid_quote_count']} != {first['invalid_quote_count']}")
             )
         if r["requirement_ids"] != first["requirement_ids"]:
-            diff_ids = [
-                rid for rid in set(r["requirement_ids"]) | set(first["requirement_ids"])
-                if (r["requirement_ids"].count(rid) if rid in r["requirement_ids"] else 0)
-                != (first["requirement_ids"].count(rid) if rid in first["requirement_ids"] else 0)
-            ]
+            # ids whose multiplicity differs from run 1, in either direction
+            run_ids = Counter(r["requirement_ids"])
+            diff_ids = list((run_ids - first_ids) + (first_ids - run_ids))
             variances.append(("requirement_ids", run_num, f"diff: {diff_ids[:5]}"))
         if r["match_pairs"] != first["match_pairs"]:
             diff_pairs = [
@@ -1,26 +1,60 @@
 #!/usr/bin/env python3
 """
 Run idempotency check: same (resume, JD) N times; output variance report if not identical.
-Usage: python scripts/run_idempotency_check.py [--runs 10] [--jd path] [--resume path]
+Usage: python scripts/run_idempotency_check.py [--runs 10] [--jd path] [--resume path] [--save-evidence]
 """
 
 import argparse
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from gap_analyzer import extract_text_from_pdf_cached
 from src.utils import hash_text
 from src.pipeline.extract import extract_requirements_from_jd
-from src.pipeline.artifacts import save_requirements_artifact, load_requirements_artifact_by_jd_hash
+from src.pipeline import llm_cache
+from src.pipeline.artifacts import ARTIFACTS_DIR, save_requirements_artifact, load_requirements_artifact_by_jd_hash
 from src.pipeline.match import match_resume_to_requirements
 from src.scoring import compute_score
 
 DEFAULT_RUNS = 10
 DEFAULT_JD = "sample_jd.txt"
 DEFAULT_RESUME = "resumes/master/Master-Copy-Resume.pdf"
+MAX_PARALLEL_RUNS = 8
+
+
+def _load_resume_text(resume_path: Path) -> str:
+    if resume_path.suffix.lower() != ".pdf":
+        return resume_path.read_text(encoding="utf-8")
+    # Same on-disk text cache as cli_pipeline.py
+    return extract_text_from_pdf_cached(resume_path)
+
+
+def _one_run(api_key: str, resume_text: str, requirements_doc: dict) -> tuple[dict, dict]:
+    """One match+score run: (summary used by the variance check, full evidence map)."""
+    evidence_map = match_resume_to_requirements(api_key, resume_text, requirements_doc)
+    score = compute_score(requirements_doc, evidence_map)
+    summary = {
+        "model_id": evidence_map.get("model_id"),
+        "matched": {m["requirement_id"]: m["matched"] for m in evidence_map["matches"]},
+        "score": score["overall_score"],
+        "total_matched": score["total_matched"],
+    }
+    return summary, evidence_map
+
+
+def _save_runs(jd_hash: str, resume_text: str, evidence_maps: list[dict], variances: list) -> Path:
+    """All runs' evidence maps plus the variance report, in one artifact file (one write)."""
+    path = ARTIFACTS_DIR / f"idempotency_{jd_hash[:16]}_{hash_text(resume_text)[:16]}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    report = [{"stage": stage, "run": run, "detail": detail} for stage, run, detail in variances]
+    path.write_text(json.dumps({"runs": evidence_maps, "variance_report": report}, indent=2), encoding="utf-8")
+    return path
 
 
 def main():
@@ -28,8 +62,18 @@ def main():
     parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
     parser.add_argument("--jd", default=DEFAULT_JD)
     parser.add_argument("--resume", default=DEFAULT_RESUME)
+    parser.add_argument(
+        "--save-evidence",
+        action="store_true",
+        help="Write every run's evidence map and the variance report to one artifacts/idempotency_*.json",
+    )
     args = parser.parse_args()
 
+    if llm_cache.enabled():
+        # Cached replies would make every run identical; this check measures the model itself
+        print("Note: ignoring GROQ_CACHE_DIR; every run calls Groq", file=sys.stderr)
+        del os.environ["GROQ_CACHE_DIR"]
+
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
         print("Error: GROQ_API_KEY required", file=sys.stderr)
@@ -47,11 +91,7 @@ def main():
         sys.exit(1)
 
     jd_text = jd_path.read_text(encoding="utf-8")
-    if resume_path.suffix.lower() == ".pdf":
-        from gap_analyzer import extract_text_from_pdf
-        resume_text = extract_text_from_pdf(resume_path)
-    else:
-        resume_text = resume_path.read_text(encoding="utf-8")
+    resume_text = _load_resume_text(resume_path)
 
     jd_hash = hash_text(jd_text)
 
@@ -60,34 +100,32 @@ def main():
         requirements_doc, _ = load_requirements_artifact_by_jd_hash(jd_hash)
     except FileNotFoundError:
         print("Creating requirements artifact...")
-        doc = extract_requirements_from_jd(api_key, jd_text)
+        doc = extract_requirements_from_jd(api_key, jd_text, jd_hash=jd_hash)
         to_save = {k: v for k, v in doc.items() if k != "_audit"}
         save_requirements_artifact(doc["role_id"], doc["jd_hash"], to_save)
         requirements_doc, _ = load_requirements_artifact_by_jd_hash(jd_hash)
 
     print(f"Running match+score {args.runs} times...")
-    results = []
-    for i in range(args.runs):
-        evidence_map = match_resume_to_requirements(api_key, resume_text, requirements_doc)
-        score = compute_score(requirements_doc, evidence_map)
-        match_by_id = {m["requirement_id"]: m["matched"] for m in evidence_map["matches"]}
-        results.append({
-            "model_id": evidence_map.get("model_id"),
-            "matched": match_by_id,
-            "score": score["overall_score"],
-            "total_matched": score["total_matched"],
-        })
+    # Runs are independent and network-bound; overlap them (Groq 429s are retried by the client)
+    with ThreadPoolExecutor(max_workers=max(1, min(args.runs, MAX_PARALLEL_RUNS))) as ex:
+        futures = [ex.submit(_one_run, api_key, resume_text, requirements_doc) for _ in range(args.runs)]
+        runs = [f.result() for f in futures]
+    results = [summary for summary, _ in runs]
 
     # Variance check
     first = results[0]
+    first_matched = first["matched"]
     variances = []
 
     for i, r in enumerate(results[1:], start=1):
-        if r["matched"] != first["matched"]:
+        matched = r["matched"]
+        if matched != first_matched:
+            # first run's ids, then any only this run returned (the model may drop or add ids)
+            keys = first_matched if matched.keys() <= first_matched.keys() else {**first_matched, **matched}
             diff = {
-                k: (r["matched"].get(k), first["matched"].get(k))
-                for k in set(r["matched"]) | set(first["matched"])
-                if r["matched"].get(k) != first["matched"].get(k)
+                k: (matched.get(k), first_matched.get(k))
+                for k in keys
+                if matched.get(k) != first_matched.get(k)
             }
             variances.append(("match", i + 1, diff))
         if r["score"] != first["score"]:
@@ -95,6 +133,10 @@ def main():
         if r["total_matched"] != first["total_matched"]:
             variances.append(("total_matched", i + 1, f"{r['total_matched']} != {first['total_matched']}"))
 
+    if args.save_evidence:
+        path = _save_runs(jd_hash, resume_text, [evidence_map for _, evidence_map in runs], variances)
+        print(f"Evidence maps: {path}")
+
     if variances:
         print("\n=== VARIANCE REPORT ===\n")
         for stage, run, detail in variances:
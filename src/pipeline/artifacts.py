@@ -1,8 +1,14 @@
 """Artifact storage: requirements and evidence maps."""
 
 import json
+import sqlite3
+import threading
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
+from src.utils import atomic_write_text, clone_json, hash_text
 from src.validation import validate_requirements
 
 ARTIFACTS_DIR = Path(__file__).resolve().parent.parent.parent / "artifacts"
@@ -13,6 +19,94 @@ def _ensure_artifacts_dir() -> Path:
     return ARTIFACTS_DIR
 
 
+# SQLite (WAL) index of requirements artifact paths keyed by jd_hash, so a cold lookup is a
+# primary-key read instead of a glob over every artifact. The JSON files are canonical: the
+# index holds only file names, and missing rows are backfilled from the files.
+INDEX_DB_NAME = "requirements_index.sqlite3"
+_DB_CONNS: dict[Path, sqlite3.Connection] = {}
+_DB_LOCK = threading.Lock()
+
+
+def _index_db() -> sqlite3.Connection:
+    db_path = _ensure_artifacts_dir() / INDEX_DB_NAME
+    with _DB_LOCK:
+        conn = _DB_CONNS.get(db_path)
+        if conn is None:
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS requirements_paths(jd_hash TEXT PRIMARY KEY, path TEXT)")
+            _DB_CONNS[db_path] = conn
+        return conn
+
+
+def _index_put(jd_hash: str, path: Path) -> None:
+    conn = _index_db()
+    with _DB_LOCK:
+        conn.execute("INSERT OR REPLACE INTO requirements_paths(jd_hash, path) VALUES (?, ?)", (jd_hash, path.name))
+
+
+def _index_get(jd_hash: str) -> Path | None:
+    conn = _index_db()
+    with _DB_LOCK:
+        row = conn.execute("SELECT path FROM requirements_paths WHERE jd_hash = ?", (jd_hash,)).fetchone()
+    if row is None:
+        return None
+    path = ARTIFACTS_DIR / row[0]
+    if not path.exists():
+        # Artifact file removed by hand; the index must not resurrect it.
+        with _DB_LOCK:
+            conn.execute("DELETE FROM requirements_paths WHERE jd_hash = ?", (jd_hash,))
+        return None
+    return path
+
+
+@lru_cache(maxsize=256)
+def _load_artifact(path: Path, mtime_ns: int, size: int) -> dict:
+    """Parsed artifact, memoized per file version (mtime/size); the key args are not read. Not to be mutated."""
+    return orjson.loads(path.read_bytes())
+
+
+@lru_cache(maxsize=256)
+def _requirements_hash(path: Path, mtime_ns: int, size: int) -> str:
+    # stdlib json on purpose: the hash is recorded provenance and must not move with the file encoder
+    return hash_text(json.dumps(_load_artifact(path, mtime_ns, size), sort_keys=True))
+
+
+def _artifact_path_by_jd_hash(jd_hash: str) -> Path:
+    path = _index_get(jd_hash)
+    if path is not None:
+        return path
+    pattern = f"*.{jd_hash}.v1.json"
+    matches = list(ARTIFACTS_DIR.glob(pattern))
+    if not matches:
+        raise FileNotFoundError(
+            f"Requirements artifact not found for jd_hash={jd_hash[:16]}... "
+            "Run POST /api/requirements/build first with the same JD. No automatic regeneration."
+        )
+    path = matches[0]
+    _index_put(jd_hash, path)
+    return path
+
+
+def _file_version(path: Path) -> tuple[Path, int, int]:
+    """(path, mtime_ns, size) cache key; raises FileNotFoundError if the file is gone."""
+    st = path.stat()
+    return path, st.st_mtime_ns, st.st_size
+
+
+def _write_if_changed(path: Path, text: str) -> None:
+    """
+    Write text unless the file already holds exactly this text (re-saves skip the disk write).
+    Writes go through a temp file and rename, so the loaders never read a half-written artifact.
+    """
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+    atomic_write_text(path, text)
+
+
 def save_requirements_artifact(role_id: str, jd_hash: str, requirements_doc: dict) -> Path:
     """Save frozen requirements. Filename: job_requirements.<role_id>.<jd_hash>.v1.json"""
     validate_requirements(requirements_doc)
@@ -20,7 +114,9 @@ def save_requirements_artifact(role_id: str, jd_hash: str, requirements_doc: dic
     safe_role = "".join(c if c.isalnum() or c in "-_" else "_" for c in role_id)
     filename = f"job_requirements.{safe_role}.{jd_hash}.v1.json"
     path = ARTIFACTS_DIR / filename
-    path.write_text(json.dumps(requirements_doc, indent=2), encoding="utf-8")
+    # stdlib json for persisted artifacts: files stay byte-identical to ones written earlier
+    _write_if_changed(path, json.dumps(requirements_doc, indent=2))
+    _index_put(jd_hash, path)
     return path
 
 
@@ -37,7 +133,7 @@ def load_requirements_artifact(role_id: str, jd_hash: str) -> dict:
             f"Requirements artifact not found: {path}. "
             "Run Stage A (extract + save) first. No automatic regeneration."
         )
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
 
 
 def load_requirements_artifact_by_jd_hash(jd_hash: str) -> tuple[dict, Path]:
@@ -46,16 +142,20 @@ def load_requirements_artifact_by_jd_hash(jd_hash: str) -> tuple[dict, Path]:
     Finds artifact matching *.<jd_hash>.v1.json.
     Returns (requirements_doc, artifact_path).
     FAILS (raises FileNotFoundError) if no artifact found. No silent regeneration.
+    The path comes from the SQLite index when present, else is found by glob and backfilled.
+    The parsed file is cached in-process per file version, so edits and deletions are seen;
+    each caller gets its own copy, so mutating it cannot leak into the cache.
     """
-    pattern = f"*.{jd_hash}.v1.json"
-    matches = list(ARTIFACTS_DIR.glob(pattern))
-    if not matches:
-        raise FileNotFoundError(
-            f"Requirements artifact not found for jd_hash={jd_hash[:16]}... "
-            "Run POST /api/requirements/build first with the same JD. No automatic regeneration."
-        )
-    path = matches[0]
-    return json.loads(path.read_text(encoding="utf-8")), path
+    path = _artifact_path_by_jd_hash(jd_hash)
+    return clone_json(_load_artifact(*_file_version(path))), path
+
+
+def requirements_hash_by_jd_hash(jd_hash: str) -> str:
+    """
+    requirements_hash (sha256 of the sort_keys JSON of the requirements doc) for the artifact
+    with this jd_hash. Computed once per artifact file version instead of re-serializing per request.
+    """
+    return _requirements_hash(*_file_version(_artifact_path_by_jd_hash(jd_hash)))
 
 
 def save_evidence_artifact(evidence_map: dict) -> Path:
@@ -66,10 +166,10 @@ def save_evidence_artifact(evidence_map: dict) -> Path:
     resume_hash = evidence_map.get("resume_hash", "unknown")[:16]
     filename = f"evidence_{jd_hash}_{resume_hash}_{run_id}.json"
     path = ARTIFACTS_DIR / filename
-    path.write_text(json.dumps(evidence_map, indent=2), encoding="utf-8")
+    _write_if_changed(path, json.dumps(evidence_map, indent=2))
     return path
 
 
 def load_evidence_artifact(path: Path) -> dict:
     """Load evidence map from path."""
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
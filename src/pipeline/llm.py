@@ -0,0 +1,65 @@
+"""Shared Groq access for the pipeline stages and the web service."""
+
+from functools import lru_cache
+
+import orjson
+from groq import Groq
+
+from src.pipeline import llm_cache
+
+# Client-side retries (exponential backoff, honors Retry-After) for 429/5xx; batch runs hit rate limits
+MAX_RETRIES = 5
+
+
+@lru_cache(maxsize=4)
+def get_client(api_key: str) -> Groq:
+    """One Groq client per API key, so every caller shares its keep-alive connection pool."""
+    return Groq(api_key=api_key, max_retries=MAX_RETRIES)
+
+
+def complete_json(
+    api_key: str,
+    prompt: str,
+    array_key: str,
+    *,
+    model_id: str,
+    prompt_version: str,
+    model_params: dict,
+) -> dict:
+    """
+    Model reply parsed as a JSON object whose array_key holds a list; served from llm_cache
+    when GROQ_CACHE_DIR is set. An invalid reply is retried once with the error fed back.
+    """
+    key = llm_cache.cache_key(model_id, prompt_version, prompt)
+    cached = llm_cache.get(key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    client = get_client(api_key)
+
+    messages = [{"role": "user", "content": prompt}]
+    for attempt in range(2):
+        response = client.chat.completions.create(
+            model=model_id,
+            messages=messages,
+            temperature=model_params["temperature"],
+            top_p=model_params.get("top_p", 1),
+            response_format={"type": "json_object"},
+        )
+        content = response.choices[0].message.content.strip()
+        try:
+            data = orjson.loads(content)
+            if not isinstance(data, dict) or not isinstance(data.get(array_key, []), list):
+                raise ValueError(f'expected a JSON object with a "{array_key}" array')
+            break
+        except ValueError as e:  # includes orjson.JSONDecodeError
+            if attempt == 1:
+                raise ValueError(f"Invalid JSON from model after retry: {e}") from e
+            # Re-running the same prompt at temperature 0 tends to fail the same way; show the error
+            messages = [
+                messages[0],
+                {"role": "assistant", "content": content},
+                {"role": "user", "content": f"Your previous output was not valid: {e}. Return only valid JSON in the requested format."},
+            ]
+    llm_cache.put(key, content, model_id, prompt_version)
+    return data
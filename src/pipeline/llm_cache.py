@@ -0,0 +1,58 @@
+"""Content-addressed on-disk cache of raw Groq replies, shared by the pipeline stages and the web app.
+
+Off unless GROQ_CACHE_DIR names a directory. Entries live at <GROQ_CACHE_DIR>/<key[:2]>/<key>.json,
+keyed on everything that shapes the reply (model, prompt version, prompts), so repeat development
+runs skip Groq. The idempotency and repeatability scripts turn it off: they measure the model,
+not the cache.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from src.utils import atomic_write_text, iso_now
+
+
+def cache_dir() -> Path | None:
+    """Cache directory from GROQ_CACHE_DIR, or None when the cache is disabled."""
+    value = os.environ.get("GROQ_CACHE_DIR")
+    return Path(value) if value else None
+
+
+def enabled() -> bool:
+    return cache_dir() is not None
+
+
+def cache_key(*parts: str) -> str:
+    """sha256 over the NUL-joined parts."""
+    return hashlib.sha256(b"\x00".join(part.encode("utf-8") for part in parts)).hexdigest()
+
+
+def _path(root: Path, key: str) -> Path:
+    return root / key[:2] / f"{key}.json"
+
+
+def get(key: str) -> str | None:
+    """Cached reply content for key, or None on miss (or when the cache is disabled)."""
+    root = cache_dir()
+    if root is None:
+        return None
+    try:
+        return json.loads(_path(root, key).read_bytes())["response"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def put(key: str, content: str, model_id: str, prompt_version: str | None = None) -> None:
+    """Store a reply. Best-effort: write failures are ignored."""
+    root = cache_dir()
+    if root is None:
+        return
+    envelope = {"model_id": model_id, "created_at": iso_now(), "response": content}
+    if prompt_version is not None:
+        envelope["prompt_version"] = prompt_version
+    try:
+        atomic_write_text(_path(root, key), json.dumps(envelope))
+    except OSError:
+        pass
@@ -3,10 +3,9 @@
 import json
 import os
 import uuid
-from pathlib import Path
-
-from groq import Groq
 
+from src.pipeline import llm
+from src.pipeline.prompts import render_prompt
 from src.utils import hash_text
 from src.pipeline.normalize import MATCH_EVIDENCE_VERSION
 from src.scoring.quote_validation import validate_evidence_quotes
@@ -17,32 +16,28 @@ MODEL_ID = os.environ.get("GROQ_MATCH_MODEL") or os.environ.get("GROQ_MODEL") or
 MODEL_PARAMS = {"temperature": 0, "top_p": 1}
 
 
-def _load_prompt(name: str) -> str:
-    prompt_path = Path(__file__).resolve().parent.parent.parent / "prompts" / f"{name}.txt"
-    return prompt_path.read_text(encoding="utf-8")
-
-
-def _strip_confidence(matches: list[dict]) -> list[dict]:
-    """Remove confidence for determinism; matched is authoritative."""
-    return [{k: v for k, v in m.items() if k != "confidence"} for m in matches]
-
-
-def _sanitize_notes(matches: list[dict]) -> None:
-    """Coerce None notes to empty string (schema expects string)."""
+def _clean_matches(matches: list[dict]) -> list[dict]:
+    """
+    In place, in one pass: remove confidence for determinism (matched is authoritative) and
+    coerce None notes to empty string (schema expects string).
+    """
     for m in matches:
+        m.pop("confidence", None)
         if m.get("notes") is None:
             m["notes"] = ""
+    return matches
 
 
 def match_resume_to_requirements(
     api_key: str,
     resume_text: str,
     requirements_doc: dict,
+    resume_hash: str | None = None,
 ) -> dict:
     """
     Stage C: LLM-assisted evidence matching.
-    Returns evidence map. Does NOT compute scores.
-    Retries once on invalid JSON; fails gracefully on second failure.
+    Returns evidence map. Does NOT compute scores. Pass resume_hash if the caller already has it.
+    Retries once on invalid JSON, feeding the error back to the model; fails gracefully on second failure.
     """
     requirements = requirements_doc.get("requirements", [])
     # Do NOT include description (JD-derived) - prevents model from echoing JD as evidence
@@ -57,30 +52,14 @@ def match_resume_to_requirements(
     ]
     reqs_json = json.dumps(reqs_for_prompt)
 
-    prompt_template = _load_prompt("match_evidence")
-    prompt = prompt_template.replace("{{requirements_json}}", reqs_json).replace("{{resume_text}}", resume_text)
+    prompt = render_prompt("match_evidence", requirements_json=reqs_json, resume_text=resume_text)
     prompt_hash = hash_text(prompt)
 
-    client = Groq(api_key=api_key)
-
-    for attempt in range(2):
-        try:
-            response = client.chat.completions.create(
-                model=MODEL_ID,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=MODEL_PARAMS["temperature"],
-                top_p=MODEL_PARAMS.get("top_p", 1),
-                response_format={"type": "json_object"},
-            )
-            content = response.choices[0].message.content.strip()
-            data = json.loads(content)
-            break
-        except json.JSONDecodeError as e:
-            if attempt == 1:
-                raise ValueError(f"Invalid JSON from model after retry: {e}") from e
+    data = llm.complete_json(
+        api_key, prompt, "matches", model_id=MODEL_ID, prompt_version=PROMPT_VERSION, model_params=MODEL_PARAMS
+    )
 
-    matches = _strip_confidence(data.get("matches", []))
-    _sanitize_notes(matches)
+    matches = _clean_matches(data.get("matches", []))
 
     # Map back to our requirement IDs (LLM may return by id or requirement_key)
     req_by_id = {r["id"]: r for r in requirements}
@@ -101,7 +80,7 @@ def match_resume_to_requirements(
         else:
             normalized_matches.append(m)
 
-    resume_hash = hash_text(resume_text)
+    resume_hash = resume_hash or hash_text(resume_text)
     run_id = str(uuid.uuid4())[:8]
 
     evidence_map = {
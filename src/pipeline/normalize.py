@@ -2,6 +2,7 @@
 
 import hashlib
 import re
+from functools import lru_cache
 
 EXTRACT_REQ_VERSION = "EXTRACT_REQ_V2"
 MATCH_EVIDENCE_VERSION = "MATCH_EVIDENCE_V2"
@@ -18,14 +19,20 @@ CATEGORY_KEYWORDS = {
     "Behavioral": ["ownership", "leadership", "mentoring", "communication", "mentorship"],
 }
 VALID_CATEGORIES = set(CATEGORY_PRECEDENCE)
+_CATEGORY_RANK = {c: i for i, c in enumerate(CATEGORY_PRECEDENCE)}
 JACCARD_THRESHOLD = 0.8
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+_UNDERSCORES_RE = re.compile(r"_+")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
+
+@lru_cache(maxsize=1024)
 def _slugify(name: str) -> str:
     """Normalize: lowercase, trim, replace non-alnum with _, collapse underscores."""
     s = (name or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _NON_ALNUM_RE.sub("_", s)
+    s = _UNDERSCORES_RE.sub("_", s).strip("_")
     return s or "unknown"
 
 
@@ -49,7 +56,7 @@ def _map_category(category: str, name: str, description: str) -> str:
     return "Technical"
 
 
-def _jaccard(a: set[str], b: set[str]) -> float:
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
     """Jaccard similarity of two token sets."""
     if not a or not b:
         return 0.0
@@ -58,10 +65,10 @@ def _jaccard(a: set[str], b: set[str]) -> float:
     return inter / union if union else 0.0
 
 
-def _token_set(text: str) -> set[str]:
-    """Tokenize for Jaccard: lowercase alphanumeric tokens."""
-    tokens = re.findall(r"[a-z0-9]+", (text or "").lower())
-    return set(tokens)
+@lru_cache(maxsize=1024)
+def _token_set(text: str) -> frozenset[str]:
+    """Tokenize for Jaccard: lowercase alphanumeric tokens. Frozen, since results are shared."""
+    return frozenset(_TOKEN_RE.findall((text or "").lower()))
 
 
 def _stable_id(requirement_key: str, category: str, must_have: bool) -> str:
@@ -104,66 +111,56 @@ def normalize_requirements(raw_requirements: list[dict]) -> list[dict]:
         if not isinstance(weight, int) or weight < 1 or weight > 5:
             weight = 3
         aliases = list(dict.fromkeys(req.get("aliases") or []))  # dedupe preserving order
+        # Built in output key order ("id" is filled in after merging) and returned as-is
         enriched.append({
-            "name": name,
+            "id": "",
             "requirement_key": key,
             "category": category,
+            "name": name,
             "description": (req.get("description") or "").strip(),
             "must_have": must_have,
             "weight": weight,
             "aliases": aliases,
         })
 
-    # Merge near-duplicates
+    # Merge near-duplicates. Token sets are computed once per entry (merged_tokens parallels
+    # merged) and refreshed only when a merge lengthens the kept name.
     merged: list[dict] = []
-    used_keys: set[str] = set()
+    merged_tokens: list[frozenset[str]] = []
 
     for curr in enriched:
         key = curr["requirement_key"]
         curr_tokens = _token_set(curr["name"]) | _token_set(curr["description"])
+        # Jaccard(a, b) <= min(|a|, |b|) / max(|a|, |b|): sets whose sizes differ by more than the
+        # threshold allows cannot merge, so skip the set operations (epsilon absorbs float rounding)
+        n = len(curr_tokens)
+        min_size = n * JACCARD_THRESHOLD - 1e-9
+        max_size = n / JACCARD_THRESHOLD + 1e-9
 
         found = False
-        for m in merged:
-            if key == m["requirement_key"]:
-                # Same key: merge
-                m["name"] = max(m["name"], curr["name"], key=len)
-                m["aliases"] = list(dict.fromkeys(m["aliases"] + curr["aliases"]))
-                m["must_have"] = m["must_have"] or curr["must_have"]
-                found = True
-                break
-            # Jaccard overlap
-            m_tokens = _token_set(m["name"]) | _token_set(m["description"])
-            if _jaccard(curr_tokens, m_tokens) >= JACCARD_THRESHOLD:
-                m["name"] = max(m["name"], curr["name"], key=len)
+        for i, m in enumerate(merged):
+            # Same key, or Jaccard overlap: merge
+            tokens = merged_tokens[i]
+            if key == m["requirement_key"] or (
+                min_size <= len(tokens) <= max_size and _jaccard(curr_tokens, tokens) >= JACCARD_THRESHOLD
+            ):
+                name = max(m["name"], curr["name"], key=len)
+                if name != m["name"]:
+                    m["name"] = name
+                    merged_tokens[i] = _token_set(name) | _token_set(m["description"])
                 m["aliases"] = list(dict.fromkeys(m["aliases"] + curr["aliases"]))
                 m["must_have"] = m["must_have"] or curr["must_have"]
                 found = True
                 break
 
         if not found:
-            merged.append(curr.copy())
+            merged.append(curr)
+            merged_tokens.append(curr_tokens)
 
-    # Assign stable IDs and build output
+    # Assign stable IDs
     for m in merged:
         m["id"] = _stable_id(m["requirement_key"], m["category"], m["must_have"])
 
     # Sort: must_have desc, category precedence asc, requirement_key asc
-    def sort_key(r):
-        prec = CATEGORY_PRECEDENCE.index(r["category"]) if r["category"] in CATEGORY_PRECEDENCE else 99
-        return (not r["must_have"], prec, r["requirement_key"])
-
-    merged.sort(key=sort_key)
-
-    return [
-        {
-            "id": r["id"],
-            "requirement_key": r["requirement_key"],
-            "category": r["category"],
-            "name": r["name"],
-            "description": r["description"],
-            "must_have": r["must_have"],
-            "weight": r["weight"],
-            "aliases": r["aliases"],
-        }
-        for r in merged
-    ]
+    merged.sort(key=lambda r: (not r["must_have"], _CATEGORY_RANK.get(r["category"], 99), r["requirement_key"]))
+    return merged
@@ -0,0 +1,26 @@
+"""Prompt templates (prompts/*.txt) with {{placeholder}} markers."""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+
+PROMPTS_DIR = Path(__file__).resolve().parent.parent.parent / "prompts"
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=8)
+def load_prompt(name: str) -> str:
+    return (PROMPTS_DIR / f"{name}.txt").read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=8)
+def _segments(name: str) -> tuple[str, ...]:
+    """Template split on placeholders: literal text at even indices, placeholder names at odd."""
+    return tuple(_PLACEHOLDER.split(load_prompt(name)))
+
+
+def render_prompt(name: str, **values: str) -> str:
+    """Fill the template's placeholders in one pass; placeholders without a value are kept as written."""
+    return "".join(
+        values.get(s, f"{{{{{s}}}}}") if i % 2 else s for i, s in enumerate(_segments(name))
+    )
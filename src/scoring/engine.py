@@ -39,44 +39,40 @@ def compute_score(
     requirements = requirements_doc.get("requirements", [])
     match_by_id = {m["requirement_id"]: m for m in evidence_map.get("matches", [])}
 
-    must_have = [r for r in requirements if r.get("must_have")]
-    nice_to_have = [r for r in requirements if not r.get("must_have")]
-
-    must_have_matched = sum(1 for r in must_have if match_by_id.get(r["id"], {}).get("matched"))
-    nice_to_have_matched = sum(1 for r in nice_to_have if match_by_id.get(r["id"], {}).get("matched"))
-
-    must_have_coverage = (must_have_matched / len(must_have) * 100) if must_have else 100.0
-    nice_to_have_coverage = (nice_to_have_matched / len(nice_to_have) * 100) if nice_to_have else 100.0
-
-    # Per-category scores
-    categories: dict[str, list] = {}
+    # One pass over requirements: must-have / nice-to-have and per-category [matched, total]
+    must_have_matched = must_have_total = nice_to_have_matched = nice_to_have_total = 0
+    categories: dict[str, list[int]] = {}
     for r in requirements:
-        cat = r.get("category", "Technical")
-        if cat not in categories:
-            categories[cat] = []
-        categories[cat].append(r)
-
-    per_category = {}
-    for cat, reqs in categories.items():
-        matched = sum(1 for r in reqs if match_by_id.get(r["id"], {}).get("matched"))
-        total = len(reqs)
-        per_category[cat] = {
-            "matched": matched,
-            "total": total,
-            "pct": round(matched / total * 100, 1) if total else 0,
-        }
+        matched = bool(match_by_id.get(r["id"], {}).get("matched"))
+        bucket = categories.setdefault(r.get("category", "Technical"), [0, 0])
+        bucket[0] += matched
+        bucket[1] += 1
+        if r.get("must_have"):
+            must_have_matched += matched
+            must_have_total += 1
+        else:
+            nice_to_have_matched += matched
+            nice_to_have_total += 1
+
+    must_have_coverage = (must_have_matched / must_have_total * 100) if must_have_total else 100.0
+    nice_to_have_coverage = (nice_to_have_matched / nice_to_have_total * 100) if nice_to_have_total else 100.0
+
+    per_category = {
+        cat: {"matched": matched, "total": total, "pct": round(matched / total * 100, 1)}
+        for cat, (matched, total) in categories.items()
+    }
 
     total_reqs = len(requirements)
-    total_matched = sum(1 for r in requirements if match_by_id.get(r["id"], {}).get("matched"))
+    total_matched = must_have_matched + nice_to_have_matched
     overall_score = round(total_matched / total_reqs * 100, 1) if total_reqs else 0
 
     return {
         "must_have_coverage": round(must_have_coverage, 1),
         "nice_to_have_coverage": round(nice_to_have_coverage, 1),
         "must_have_matched": must_have_matched,
-        "must_have_total": len(must_have),
+        "must_have_total": must_have_total,
         "nice_to_have_matched": nice_to_have_matched,
-        "nice_to_have_total": len(nice_to_have),
+        "nice_to_have_total": nice_to_have_total,
         "per_category_scores": per_category,
         "overall_score": overall_score,
         "total_matched": total_matched,
@@ -1,13 +1,23 @@
 """Hard quote validation: evidence quotes must be verbatim substrings of resume text."""
 
-import re
+from functools import lru_cache
 
 
 def normalize_text(s: str) -> str:
     """Collapse all whitespace to single spaces, strip ends."""
     if not s or not isinstance(s, str):
         return ""
-    return re.sub(r"\s+", " ", s.strip())
+    # str.split() and the regex \s agree on every code point; split/join is ~5x faster than re.sub
+    return " ".join(s.split())
+
+
+@lru_cache(maxsize=32)
+def _normalized_resume(resume_text: str) -> str:
+    """
+    normalize_text for the resume; memoized since Stage C and scoring both validate against it.
+    Sized above evaluate-batch's default concurrency so interleaved resumes do not evict each other.
+    """
+    return normalize_text(resume_text)
 
 
 def validate_evidence_quotes(
@@ -20,9 +30,12 @@ def validate_evidence_quotes(
     Returns evidence_map (mutated).
     """
     matches = evidence_map.get("matches", [])
-    resume_norm = normalize_text(resume_text)
     invalid_quote_count = 0
     matched_count_raw = sum(1 for m in matches if m.get("matched") is True)
+    # Nothing to check when no entry claims a match: skip normalizing the resume
+    resume_norm = _normalized_resume(resume_text) if matched_count_raw and isinstance(resume_text, str) else ""
+    # The same resume line is often quoted for several requirements; search each quote once
+    found: dict[str, bool] = {}
 
     for m in matches:
         if m.get("matched") is not True:
@@ -39,7 +52,13 @@ def validate_evidence_quotes(
         any_invalid = False
         for q in quotes:
             qn = normalize_text(q)
-            if len(qn) < min_len or qn not in resume_norm:
+            if len(qn) < min_len:
+                any_invalid = True
+                break
+            ok = found.get(qn)
+            if ok is None:
+                ok = found[qn] = qn in resume_norm
+            if not ok:
                 any_invalid = True
                 break
 
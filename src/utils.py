@@ -1,7 +1,15 @@
 """Utilities for hashing and audit metadata."""
 
+import copy
 import hashlib
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from pathlib import Path
+from typing import BinaryIO
+
+import orjson
 
 
 def hash_text(text: str) -> str:
@@ -12,3 +20,46 @@ def hash_text(text: str) -> str:
 def iso_now() -> str:
     """Current UTC timestamp as ISO string."""
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+@contextmanager
+def atomic_open(path: Path) -> Iterator[BinaryIO]:
+    """
+    Binary file written via a uniquely named temp file and renamed over path on a clean exit,
+    so readers never see a partial file. On error the temp file is removed.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            yield f
+        tmp.replace(path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write data through atomic_open."""
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """atomic_write_bytes for UTF-8 text."""
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+def clone_json(data):
+    """
+    Deep copy of JSON-shaped data (dicts/lists of str, numbers, bools, None) via an orjson
+    round trip, several times faster than copy.deepcopy. Anything orjson cannot represent
+    exactly (big ints, non-str keys, NaN/inf) falls back to deepcopy.
+    """
+    try:
+        clone = orjson.loads(orjson.dumps(data))
+    except orjson.JSONEncodeError:
+        return copy.deepcopy(data)
+    if clone != data:  # NaN/inf serialize as null
+        return copy.deepcopy(data)
+    return clone
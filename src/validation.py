@@ -1,25 +1,104 @@
 """Schema validation for requirements and evidence maps."""
 
-import json
+import hashlib
+import importlib
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 import jsonschema
+import orjson
+from jsonschema.exceptions import best_match
 
 SCHEMAS_DIR = Path(__file__).resolve().parent.parent / "schemas"
 
+# fastjsonschema compiles each schema to specialized Python code, several times faster than
+# jsonschema's interpreter. It is optional; when installed it decides the (common) valid case,
+# and jsonschema still builds the error for invalid data so messages stay identical.
+_HAS_FASTJSONSCHEMA = importlib.util.find_spec("fastjsonschema") is not None
+
 
 def _load_schema(name: str) -> dict:
     path = SCHEMAS_DIR / f"{name}.schema.json"
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
+
+
+def schema_sha256(name: str) -> str:
+    """sha256 of the schema file; generated validators record it to detect a stale build."""
+    return hashlib.sha256((SCHEMAS_DIR / f"{name}.schema.json").read_bytes()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _get_validator(name: str) -> jsonschema.protocols.Validator:
+    """Schema checked and validator built once per schema; validation calls reuse it."""
+    schema = _load_schema(name)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+@lru_cache(maxsize=None)
+def _get_fast_validator(name: str):
+    import fastjsonschema
+
+    # Prebuilt by scripts/gen_validators.py: skips code generation at startup
+    try:
+        generated = importlib.import_module(f"src._validators.{name}")
+    except ImportError:
+        generated = None
+    if generated is not None and generated.SCHEMA_SHA256 == schema_sha256(name):
+        return generated.validate
+
+    schema = _load_schema(name)
+    try:
+        # Like the jsonschema validator (no FormatChecker): skip per-instance "format" regexes
+        return fastjsonschema.compile(schema, use_formats=False)
+    except TypeError:  # fastjsonschema < 2.17 has no use_formats
+        return fastjsonschema.compile(schema)
+
+
+def _is_valid(name: str, data: dict) -> bool:
+    """Boolean check: stops at the first violation and builds no error objects."""
+    if _HAS_FASTJSONSCHEMA:
+        import fastjsonschema
+
+        try:
+            _get_fast_validator(name)(data)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            pass  # jsonschema has the final say (older fastjsonschema also checks "format")
+    return _get_validator(name).is_valid(data)
+
+
+def _validate(name: str, data: dict) -> None:
+    if _is_valid(name, data):
+        return
+    # Same error jsonschema.validate would raise: the best match among all errors
+    raise best_match(_get_validator(name).iter_errors(data))
+
+
+def is_valid_requirements(data: dict) -> bool:
+    """True if job requirements match the schema. Use validate_requirements for the error."""
+    return _is_valid("job_requirements", data)
+
+
+def is_valid_evidence_map(data: dict) -> bool:
+    """True if the evidence map matches the schema. Use validate_evidence_map for the error."""
+    return _is_valid("evidence_map", data)
 
 
 def validate_requirements(data: dict) -> None:
     """Validate job requirements against schema. Raises jsonschema.ValidationError if invalid."""
-    schema = _load_schema("job_requirements")
-    jsonschema.validate(data, schema)
+    _validate("job_requirements", data)
 
 
 def validate_evidence_map(data: dict) -> None:
     """Validate evidence map against schema. Raises jsonschema.ValidationError if invalid."""
-    schema = _load_schema("evidence_map")
-    jsonschema.validate(data, schema)
+    _validate("evidence_map", data)
+
+
+# Compile at import so the first request does not pay for it
+for _name in ("job_requirements", "evidence_map"):
+    _get_validator(_name)
+    if _HAS_FASTJSONSCHEMA:
+        _get_fast_validator(_name)
@@ -0,0 +1,130 @@
+"""Artifact cache test: repeat loads by jd_hash are served from memory; file changes invalidate."""
+
+import json
+import os
+
+import pytest
+
+from src.pipeline import artifacts
+from src.pipeline.artifacts import save_requirements_artifact, load_requirements_artifact_by_jd_hash
+from src.utils import hash_text
+
+
+JD_HASH = "c" * 64
+
+
+def _requirements_doc(name: str) -> dict:
+    return {
+        "role_id": "cache_role",
+        "jd_hash": JD_HASH,
+        "requirements_version": "1.0.0",
+        "created_at": "2025-01-01T00:00:00Z",
+        "requirements": [
+            {"id": "REQ-001", "category": "Technical", "name": name, "description": "", "must_have": True, "weight": 3},
+        ],
+    }
+
+
+@pytest.fixture(autouse=True)
+def isolated_artifacts_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACTS_DIR", tmp_path)
+    artifacts._load_artifact.cache_clear()
+    artifacts._requirements_hash.cache_clear()
+    yield
+    artifacts._load_artifact.cache_clear()
+    artifacts._requirements_hash.cache_clear()
+
+
+def test_repeat_load_is_cached():
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    doc1, path1 = load_requirements_artifact_by_jd_hash(JD_HASH)
+    doc2, path2 = load_requirements_artifact_by_jd_hash(JD_HASH)
+    assert artifacts._load_artifact.cache_info().hits == 1
+    assert doc1 == doc2
+    assert path1 == path2
+
+
+def test_loaded_docs_are_isolated_from_the_cache():
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    doc1, _ = load_requirements_artifact_by_jd_hash(JD_HASH)
+    doc1["requirements"][0]["name"] = "mutated"
+    doc1["extra"] = "mutated"
+    doc2, _ = load_requirements_artifact_by_jd_hash(JD_HASH)
+    assert doc2["requirements"][0]["name"] == "Python"
+    assert "extra" not in doc2
+
+
+def test_save_invalidates_cache():
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    doc1, _ = load_requirements_artifact_by_jd_hash(JD_HASH)
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("SQL"))
+    doc2, _ = load_requirements_artifact_by_jd_hash(JD_HASH)
+    assert doc1["requirements"][0]["name"] == "Python"
+    assert doc2["requirements"][0]["name"] == "SQL"
+
+
+def test_missing_artifact_is_not_cached():
+    with pytest.raises(FileNotFoundError):
+        load_requirements_artifact_by_jd_hash(JD_HASH)
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    doc, _ = load_requirements_artifact_by_jd_hash(JD_HASH)
+    assert doc["jd_hash"] == JD_HASH
+
+
+def test_index_backfills_from_existing_file(tmp_path):
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    (tmp_path / artifacts.INDEX_DB_NAME).unlink()
+    artifacts._DB_CONNS.clear()
+    doc, path = load_requirements_artifact_by_jd_hash(JD_HASH)
+    assert doc["requirements"][0]["name"] == "Python"
+    assert artifacts._index_get(JD_HASH) == path
+
+
+def test_index_ignores_deleted_artifact_file():
+    path = save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        load_requirements_artifact_by_jd_hash(JD_HASH)
+
+
+def test_requirements_hash_matches_sorted_json_and_tracks_saves():
+    doc = _requirements_doc("Python")
+    save_requirements_artifact("cache_role", JD_HASH, doc)
+    assert artifacts.requirements_hash_by_jd_hash(JD_HASH) == hash_text(json.dumps(doc, sort_keys=True))
+    updated = _requirements_doc("SQL")
+    save_requirements_artifact("cache_role", JD_HASH, updated)
+    assert artifacts.requirements_hash_by_jd_hash(JD_HASH) == hash_text(json.dumps(updated, sort_keys=True))
+
+
+def test_identical_resave_skips_write():
+    path = save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    os.utime(path, ns=(0, 0))
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    assert path.stat().st_mtime_ns == 0
+    save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("SQL"))
+    assert path.stat().st_mtime_ns != 0
+    assert json.loads(path.read_text(encoding="utf-8"))["requirements"][0]["name"] == "SQL"
+
+
+def test_hand_edited_artifact_is_reloaded():
+    path = save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    load_requirements_artifact_by_jd_hash(JD_HASH)
+    path.write_text(json.dumps(_requirements_doc("Go"), indent=2), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    doc, _ = load_requirements_artifact_by_jd_hash(JD_HASH)
+    assert doc["requirements"][0]["name"] == "Go"
+    assert artifacts.requirements_hash_by_jd_hash(JD_HASH) == hash_text(json.dumps(doc, sort_keys=True))
+
+
+def test_loaded_artifact_deleted_later_is_not_served():
+    path = save_requirements_artifact("cache_role", JD_HASH, _requirements_doc("Python"))
+    load_requirements_artifact_by_jd_hash(JD_HASH)
+    path.unlink()
+    with pytest.raises(FileNotFoundError):
+        load_requirements_artifact_by_jd_hash(JD_HASH)
+
+
+def test_artifact_bytes_match_stdlib_json():
+    doc = _requirements_doc("Résumé parsing")
+    path = save_requirements_artifact("cache_role", JD_HASH, doc)
+    assert path.read_bytes() == json.dumps(doc, indent=2).encode("utf-8")
@@ -0,0 +1,134 @@
+"""Audit writer test: entries are queued off the caller thread and land on disk after flush."""
+
+import csv
+import gzip
+import json
+import logging
+
+import pytest
+
+from gap_analyzer import audit
+
+
+@pytest.fixture(autouse=True)
+def isolated_log_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "AUDIT_DIR", tmp_path)
+    monkeypatch.setattr(audit, "AUDIT_FILE", tmp_path / "audit.log")
+    monkeypatch.setattr(audit, "MODEL_PERF_CSV", tmp_path / "model_performance.csv")
+    yield
+    audit.flush_audit()
+
+
+def test_audit_log_entries_written_in_order(tmp_path):
+    for i in range(50):
+        audit.audit_log(action="analyze", status="success", match_score=i)
+    audit.flush_audit()
+    lines = (tmp_path / "audit.log").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["match_score"] for line in lines] == list(range(50))
+
+
+def test_model_performance_writes_jsonl_and_csv(tmp_path):
+    gap_report = [
+        {"name": "Python", "status": "MATCH"},
+        {"name": "AWS", "status": "MISSING"},
+    ]
+    audit.log_model_performance(
+        model="mock",
+        use_mock=True,
+        match_score=50,
+        role_title="Engineer",
+        candidate_name="Jane",
+        criteria_used=[{"name": "Python"}, {"name": "AWS"}],
+        gap_report=gap_report,
+        jd_char_count=10,
+        resume_char_count=20,
+        invalid_quote_count=0,
+    )
+    audit.flush_audit()
+    entry = json.loads((tmp_path / "model_performance.jsonl").read_text(encoding="utf-8"))
+    assert entry["num_matches"] == 1 and entry["num_missing"] == 1
+    with open(tmp_path / "model_performance.csv", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 1
+    assert rows[0]["jd_hash"] == ""
+    assert rows[0]["invalid_quote_count"] == "0"
+    assert rows[0]["matched_count_raw"] == ""
+    assert json.loads(rows[0]["gap_details"]) == gap_report
+
+
+def test_csv_header_written_once_across_batches(tmp_path):
+    for score in (10, 20):
+        audit.log_model_performance(
+            model="mock",
+            use_mock=True,
+            match_score=score,
+            role_title="Engineer",
+            candidate_name="Jane",
+            criteria_used=[],
+            gap_report=[],
+            jd_char_count=1,
+            resume_char_count=1,
+        )
+        audit.flush_audit()
+    lines = (tmp_path / "model_performance.csv").read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("timestamp,")
+    assert sum(line.startswith("timestamp,") for line in lines) == 1
+    assert len(lines) == 3
+
+
+def test_audit_log_serializes_non_json_values_as_strings(tmp_path):
+    audit.audit_log(action="upload", status="success", extra={"path": tmp_path, "text": "Résumé"})
+    audit.flush_audit()
+    entry = json.loads((tmp_path / "audit.log").read_text(encoding="utf-8"))
+    assert entry["path"] == str(tmp_path)
+    assert entry["text"] == "Résumé"
+
+
+def test_full_log_files_rotate_to_gzip_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "AUDIT_MAX_BYTES", 1)
+    for i in range(2):
+        audit.audit_log(action="analyze", status="success", match_score=i)
+        audit.flush_audit()
+    segments = sorted(tmp_path.glob("audit.*.log.gz"))
+    assert len(segments) == 2
+    scores = [json.loads(gzip.decompress(p.read_bytes()))["match_score"] for p in segments]
+    assert scores == [0, 1]
+    assert not (tmp_path / "audit.log").exists()
+
+
+def test_audit_log_keeps_newest_backup_count_segments(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "AUDIT_MAX_BYTES", 1)
+    monkeypatch.setattr(audit, "AUDIT_BACKUP_COUNT", 2)
+    for i in range(4):
+        audit.audit_log(action="analyze", status="success", match_score=i)
+        audit.flush_audit()
+    segments = sorted(tmp_path.glob("audit.*.log.gz"))
+    scores = [json.loads(gzip.decompress(p.read_bytes()))["match_score"] for p in segments]
+    assert scores == [2, 3]
+
+
+def test_file_rotated_by_another_process_is_reopened(tmp_path):
+    audit.audit_log(action="analyze", status="success", match_score=0)
+    audit.flush_audit()
+    # Another worker rotates the live file while this process still holds its fd
+    (tmp_path / "audit.log").rename(tmp_path / "audit.rotated.log")
+    audit.audit_log(action="analyze", status="success", match_score=1)
+    audit.flush_audit()
+    assert json.loads((tmp_path / "audit.log").read_text(encoding="utf-8"))["match_score"] == 1
+    assert json.loads((tmp_path / "audit.rotated.log").read_text(encoding="utf-8"))["match_score"] == 0
+
+
+def test_app_log_rotates_through_shared_append(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit, "APP_LOG_FILE", tmp_path / "app.log")
+    monkeypatch.setattr(audit, "APP_LOG_MAX_BYTES", 1)
+    monkeypatch.setattr(audit, "APP_LOG_BACKUP_COUNT", 2)
+    logger = logging.getLogger("audit_queue_test.app_log")
+    handler = audit._AppLogHandler()
+    logger.addHandler(handler)
+    try:
+        for i in range(4):
+            logger.warning("line %d", i)
+    finally:
+        logger.removeHandler(handler)
+    segments = sorted(tmp_path.glob("app.*.log.gz"))
+    assert [gzip.decompress(p.read_bytes()) for p in segments] == [b"line 2\n", b"line 3\n"]
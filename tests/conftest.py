@@ -0,0 +1,84 @@
+"""Shared test fixtures."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.pipeline import llm
+
+
+def _stream_chunks(text: str, size: int = 7):
+    for i in range(0, len(text), size):
+        delta = SimpleNamespace(content=text[i:i + size])
+        yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class FakeCompletions:
+    """
+    Stand-in for a Groq client's chat.completions: records each create() call's kwargs.
+
+    content is the reply text, or a list of replies consumed one per call; by_model
+    overrides the reply for specific models. stream=True calls get the reply in chunks.
+    """
+
+    def __init__(self, content: str | list[str], by_model: dict[str, str] | None = None):
+        self.content = content
+        self.by_model = by_model or {}
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs["model"] in self.by_model:
+            text = self.by_model[kwargs["model"]]
+        elif isinstance(self.content, list):
+            text = self.content[len(self.calls) - 1]
+        else:
+            text = self.content
+        if kwargs.get("stream"):
+            return _stream_chunks(text)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+class FakeAsyncCompletions(FakeCompletions):
+    async def create(self, **kwargs):
+        return FakeCompletions.create(self, **kwargs)
+
+
+class FakeGroqClient:
+    """Stand-in for groq.Groq / groq.AsyncGroq (including use as an async context manager)."""
+
+    def __init__(self, completions: FakeCompletions):
+        self.chat = SimpleNamespace(completions=completions)
+        self.closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_groq():
+    """
+    Factory for fake Groq clients: fake_groq(content, by_model=None, is_async=False).
+    The client's chat.completions.calls lists the kwargs of every request.
+    """
+
+    def make(content: str | list[str], by_model: dict[str, str] | None = None, is_async: bool = False):
+        completions_cls = FakeAsyncCompletions if is_async else FakeCompletions
+        return FakeGroqClient(completions_cls(content, by_model))
+
+    return make
+
+
+@pytest.fixture
+def calls(monkeypatch, fake_groq) -> list:
+    """
+    Requests sent through llm.get_client (pipeline stages and web service) to a fake client
+    that always replies with a valid requirements document.
+    """
+    client = fake_groq(json.dumps({"role_title": "Engineer", "requirements": []}))
+    monkeypatch.setattr(llm, "get_client", lambda api_key: client)
+    return client.chat.completions.calls
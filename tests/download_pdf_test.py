@@ -0,0 +1,57 @@
+"""Download PDF route test: stable saved filename, ETag keyed on the text, 304 on a matching If-None-Match."""
+
+import pytest
+
+import app as app_module
+from gap_analyzer import audit
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, "RESUMES_DIR", tmp_path / "resumes")
+    monkeypatch.setattr(app_module, "audit_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(audit, "APP_LOG_FILE", tmp_path / "app.log")
+    monkeypatch.setattr(app_module, "_SAVED_PDFS", {})
+    monkeypatch.delenv("PDF_ACCEL_REDIRECT_PREFIX", raising=False)
+    return app_module.app.test_client()
+
+
+def _download(client, text, **headers):
+    body = {"tailored_text": text, "candidate_name": "Jane Doe", "company_name": "Acme"}
+    return client.post("/api/download-pdf", json=body, headers=headers)
+
+
+def test_download_saves_under_stable_name_and_sets_etag(client, tmp_path):
+    resp = _download(client, "# Jane Doe\n- Python")
+    assert resp.status_code == 200
+    assert resp.data.startswith(b"%PDF-")
+    etag = resp.get_etag()[0]
+    saved = tmp_path / "resumes" / "Acme" / "Jane_Doe_Tailored_Resume.pdf"
+    assert saved.read_bytes() == resp.data
+    assert _download(client, "# Jane Doe\n- Python").get_etag()[0] == etag
+
+
+def test_matching_if_none_match_returns_304(client):
+    etag = _download(client, "# Jane Doe\n- Python").get_etag()[0]
+    resp = _download(client, "# Jane Doe\n- Python", **{"If-None-Match": f'"{etag}"'})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.get_etag()[0] == etag
+
+
+def test_edited_text_replaces_saved_copy(client, tmp_path):
+    first = _download(client, "# Jane Doe\n- Python")
+    second = _download(client, "# Jane Doe\n- Python and Go", **{"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 200
+    assert second.get_etag()[0] != first.get_etag()[0]
+    assert [p.name for p in (tmp_path / "resumes" / "Acme").iterdir()] == ["Jane_Doe_Tailored_Resume.pdf"]
+    assert (tmp_path / "resumes" / "Acme" / "Jane_Doe_Tailored_Resume.pdf").read_bytes() == second.data
+
+
+def test_saved_copy_changed_on_disk_is_rerendered(client, tmp_path):
+    _download(client, "# Jane Doe\n- Python")
+    saved = tmp_path / "resumes" / "Acme" / "Jane_Doe_Tailored_Resume.pdf"
+    saved.write_bytes(b"not the render")
+    resp = _download(client, "# Jane Doe\n- Python")
+    assert resp.data.startswith(b"%PDF-")
+    assert saved.read_bytes() == resp.data
@@ -0,0 +1,142 @@
+"""GapAnalyzer response cache: repeat analyses of the same JD/résumé skip the Groq call."""
+
+import asyncio
+import json
+
+import pytest
+
+from gap_analyzer import analyzer
+from gap_analyzer.analyzer import GapAnalyzer
+
+
+FULL_REPORT = {
+    "strengths": ["Python"],
+    "gaps": ["AWS"],
+    "recommendations": ["Add AWS"],
+    "keywords_to_add": ["Lambda"],
+    "fit_score": 7,
+    "fit_justification": "Solid core skills.",
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    analyzer._RESPONSE_CACHE.clear()
+    yield
+    analyzer._RESPONSE_CACHE.clear()
+
+
+@pytest.fixture
+def make_analyzer(fake_groq):
+    """make_analyzer(content, by_model=None) -> (GapAnalyzer on a fake client, its completions)."""
+
+    def make(content: str, by_model: dict[str, str] | None = None):
+        ga = GapAnalyzer(api_key="test-key")
+        ga.client = fake_groq(content, by_model)
+        return ga, ga.client.chat.completions
+
+    return make
+
+
+def test_repeat_analysis_is_cached(make_analyzer):
+    ga, completions = make_analyzer(json.dumps(FULL_REPORT))
+    first = ga.analyze("Python role", "Python dev")
+    second = ga.analyze("Python role", "Python dev")
+    assert first == second == FULL_REPORT
+    assert len(completions.calls) == 1
+    assert completions.calls[0]["temperature"] == 0
+    assert completions.calls[0]["response_format"] == {"type": "json_object"}
+
+
+def test_model_is_part_of_cache_key(make_analyzer):
+    ga, completions = make_analyzer(json.dumps(FULL_REPORT))
+    ga.analyze("jd", "resume")
+    ga.model = "other-model"
+    ga.analyze("jd", "resume")
+    assert len(completions.calls) == 2
+
+
+def test_whitespace_only_differences_hit_cache(make_analyzer):
+    ga, completions = make_analyzer(json.dumps(FULL_REPORT))
+    ga.analyze("Python  role\n", "Python\ndev")
+    ga.analyze("Python role", "Python dev")
+    assert len(completions.calls) == 1
+
+
+def test_cached_result_is_not_shared(make_analyzer):
+    ga, _ = make_analyzer(json.dumps(FULL_REPORT))
+    ga.analyze("jd", "resume")["gaps"].append("mutated")
+    assert ga.analyze("jd", "resume") == FULL_REPORT
+
+
+def test_structured_and_text_cached_separately(make_analyzer):
+    ga, completions = make_analyzer("plain analysis")
+    ga.model = analyzer.FALLBACK_MODEL
+    assert ga.analyze("jd", "resume", structured=False) == "plain analysis"
+    assert ga.analyze("jd", "resume", structured=True) == {"raw_analysis": "plain analysis"}
+    assert len(completions.calls) == 2
+
+
+def test_analyze_many_preserves_order_and_shares_cache(make_analyzer, fake_groq):
+    other = {**FULL_REPORT, "fit_score": 8}
+    ga, completions = make_analyzer(json.dumps(FULL_REPORT))
+    aclient = fake_groq(json.dumps(other), is_async=True)
+    ga._async_client = lambda: aclient
+    ga.analyze("jd-a", "resume")
+    results = asyncio.run(ga.analyze_many([("jd-a", "resume"), ("jd-b", "resume"), ("jd-c", "resume")]))
+    assert results == [FULL_REPORT, other, other]
+    assert aclient.closed
+    assert len(completions.calls) == 1
+    assert len(aclient.chat.completions.calls) == 2
+
+
+def test_incomplete_reply_escalates_to_fallback_model(make_analyzer):
+    ga, completions = make_analyzer(
+        "not json",
+        by_model={analyzer.FALLBACK_MODEL: json.dumps(FULL_REPORT)},
+    )
+    assert ga.analyze("jd", "resume") == FULL_REPORT
+    assert [c["model"] for c in completions.calls] == [analyzer.DEFAULT_MODEL, analyzer.FALLBACK_MODEL]
+    assert ga.analyze("jd", "resume") == FULL_REPORT
+    assert len(completions.calls) == 2
+
+
+def test_analyze_stream_yields_fields_as_they_complete(make_analyzer):
+    content = "```json\n" + json.dumps({**FULL_REPORT, "fit_justification": 'Has "Python", {braces}, [brackets]'}) + "\n```"
+    ga, completions = make_analyzer(content)
+    fields = list(ga.analyze_stream("jd", "resume", structured=True))
+    assert [k for k, _ in fields] == list(FULL_REPORT)
+    assert dict(fields)["fit_justification"] == 'Has "Python", {braces}, [brackets]'
+    assert completions.calls[0]["stream"] is True
+    # Finished analysis is cached for analyze()
+    assert ga.analyze("jd", "resume")["gaps"] == ["AWS"]
+    assert len(completions.calls) == 1
+
+
+def test_streamed_fields_are_not_shared_with_cache(make_analyzer):
+    ga, _ = make_analyzer(json.dumps(FULL_REPORT))
+    for name, value in ga.analyze_stream("jd", "resume", structured=True):
+        if name == "strengths":
+            value.append("mutated")
+    assert ga.analyze("jd", "resume") == FULL_REPORT
+
+
+def test_partial_stream_is_not_cached(make_analyzer, fake_groq):
+    ga, _ = make_analyzer('{"strengths": ["Python"], "gaps": [oops], "fit_score": 3}')
+    assert dict(ga.analyze_stream("jd", "resume", structured=True)) == {"strengths": ["Python"], "fit_score": 3}
+    ga.client = fake_groq("not json", by_model={analyzer.FALLBACK_MODEL: json.dumps(FULL_REPORT)})
+    assert ga.analyze("jd", "resume") == FULL_REPORT
+    assert [c["model"] for c in ga.client.chat.completions.calls] == [analyzer.DEFAULT_MODEL, analyzer.FALLBACK_MODEL]
+
+
+def test_analyze_stream_text_deltas(make_analyzer):
+    ga, _ = make_analyzer("Strengths: Python. Gaps: AWS.")
+    assert "".join(ga.analyze_stream("jd", "resume")) == "Strengths: Python. Gaps: AWS."
+
+
+def test_long_inputs_are_truncated_head_and_tail():
+    ga = GapAnalyzer(api_key="test-key")
+    resume = "HEAD " + "x" * 20000 + " TAIL"
+    prompt = ga._build_prompt("jd", resume, structured=True)
+    assert "HEAD" in prompt and "TAIL" in prompt
+    assert len(prompt) < analyzer.MAX_INPUT_TOKENS * 4 + 1000
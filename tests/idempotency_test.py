@@ -37,6 +37,12 @@ def _read_fixture_resume():
     return extract_text_from_pdf(p)
 
 
+@pytest.fixture(autouse=True)
+def no_llm_cache(monkeypatch):
+    """Runs must reach the model; GROQ_CACHE_DIR would make them identical by construction."""
+    monkeypatch.delenv("GROQ_CACHE_DIR", raising=False)
+
+
 @pytest.mark.skipif(not os.environ.get("GROQ_API_KEY"), reason="GROQ_API_KEY not set")
 def test_extract_normalize_idempotency():
     """Run extract + normalize 10x; assert normalized requirement ids and keys identical."""
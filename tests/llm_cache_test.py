@@ -0,0 +1,26 @@
+"""Pipeline LLM cache test: GROQ_CACHE_DIR serves repeat extract prompts from disk."""
+
+import json
+
+from src.pipeline import extract
+
+
+def test_repeat_extract_served_from_cache(tmp_path, monkeypatch, calls):
+    monkeypatch.setenv("GROQ_CACHE_DIR", str(tmp_path))
+    first = extract.extract_requirements_from_jd("key", "Python role")
+    second = extract.extract_requirements_from_jd("key", "Python role")
+    assert len(calls) == 1
+    assert first["_audit"]["prompt_hash"] == second["_audit"]["prompt_hash"]
+    assert first["role_title"] == second["role_title"] == "Engineer"
+    envelope = json.loads(next(tmp_path.glob("*/*.json")).read_text(encoding="utf-8"))
+    assert envelope["model_id"] == extract.MODEL_ID
+    assert envelope["prompt_version"] == extract.PROMPT_VERSION
+
+
+def test_cache_off_by_default(tmp_path, monkeypatch, calls):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GROQ_CACHE_DIR", raising=False)
+    extract.extract_requirements_from_jd("key", "Python role")
+    extract.extract_requirements_from_jd("key", "Python role")
+    assert len(calls) == 2
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,43 @@
+"""Stage A retry test: an invalid reply is retried with the error fed back, not the bare prompt."""
+
+import json
+
+import pytest
+
+from src.pipeline import extract, llm
+
+
+@pytest.fixture
+def scripted_client(monkeypatch, fake_groq):
+    """scripted_client(replies) -> the messages of each Stage A request, replied to in order."""
+
+    def install(replies: list[str]) -> list:
+        client = fake_groq(replies)
+        monkeypatch.setattr(llm, "get_client", lambda api_key: client)
+        monkeypatch.delenv("GROQ_CACHE_DIR", raising=False)
+        return client.chat.completions.calls
+
+    return install
+
+
+def _messages(calls: list) -> list:
+    return [c["messages"] for c in calls]
+
+
+def test_invalid_json_retried_with_feedback(scripted_client):
+    good = json.dumps({"role_title": "Engineer", "requirements": []})
+    calls = scripted_client(["{not json", good])
+    doc = extract.extract_requirements_from_jd("key", "Python role")
+    assert doc["role_title"] == "Engineer"
+    assert len(calls) == 2
+    first, retry = _messages(calls)
+    assert retry[0] == first[0]
+    assert retry[1] == {"role": "assistant", "content": "{not json"}
+    assert retry[2]["role"] == "user" and "not valid" in retry[2]["content"]
+
+
+def test_wrong_shape_retried_then_fails(scripted_client):
+    calls = scripted_client(['{"requirements": "Python"}', "[]"])
+    with pytest.raises(ValueError, match="after retry"):
+        extract.extract_requirements_from_jd("key", "Python role")
+    assert len(calls) == 2
@@ -0,0 +1,48 @@
+"""PDF text cache test: unchanged files are extracted once; rewriting the file re-extracts."""
+
+import os
+
+from gap_analyzer import pdf_parser
+from gap_analyzer.tailored_pdf import generate_tailored_pdf
+
+
+def test_unchanged_pdf_extracted_once(tmp_path, monkeypatch):
+    calls = []
+    real = pdf_parser._extract_text
+
+    def counting(source):
+        calls.append(source)
+        return real(source)
+
+    monkeypatch.setattr(pdf_parser, "_extract_text", counting)
+    pdf_parser._extract_text_cached.cache_clear()
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(generate_tailored_pdf("# Jane Doe\nPython engineer"))
+
+    first = pdf_parser.extract_text_from_pdf(path)
+    assert pdf_parser.extract_text_from_pdf(str(path)) == first
+    assert "Python engineer" in first
+    assert len(calls) == 1
+
+    path.write_bytes(generate_tailored_pdf("# Jane Doe\nGo engineer"))
+    os.utime(path, ns=(1, 1))
+    assert "Go engineer" in pdf_parser.extract_text_from_pdf(path)
+    assert len(calls) == 2
+
+
+def test_disk_text_cache_is_keyed_on_backend(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_parser, "TEXT_CACHE_DIR", tmp_path / "cache")
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(generate_tailored_pdf("# Jane Doe\nPython engineer"))
+
+    pdf_parser._parser_id.cache_clear()
+    text = pdf_parser.extract_text_from_pdf_cached(path)
+    assert "Python engineer" in text
+    assert pdf_parser.extract_text_from_pdf_cached(path) == text
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    # Another backend does not reuse text extracted by the first
+    monkeypatch.setattr(pdf_parser, "_parser_id", lambda: "pymupdf-test")
+    monkeypatch.setattr(pdf_parser, "_extract_text", lambda source: "other backend")
+    assert pdf_parser.extract_text_from_pdf_cached(path) == "other backend"
+    assert len(list((tmp_path / "cache").iterdir())) == 2
@@ -0,0 +1,23 @@
+"""PDF worker pool test: a crashed worker does not break later parses; small uploads skip the pool."""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from gap_analyzer import pdf_parser
+from gap_analyzer.tailored_pdf import generate_tailored_pdf
+
+
+def test_pool_is_rebuilt_after_worker_crash(monkeypatch):
+    monkeypatch.setattr(pdf_parser, "PDF_INLINE_MAX_BYTES", 0)
+    with pytest.raises(BrokenProcessPool):
+        pdf_parser._run_in_pool(os._exit, 1)
+    text = pdf_parser.extract_text_in_pool(generate_tailored_pdf("# Jane Doe\nPython engineer"))
+    assert "Python engineer" in text
+
+
+def test_small_upload_is_parsed_inline(monkeypatch):
+    monkeypatch.setattr(pdf_parser, "_run_in_pool", lambda *args: pytest.fail("small upload sent to the pool"))
+    text = pdf_parser.extract_text_in_pool(generate_tailored_pdf("# Jane Doe\nPython engineer"))
+    assert "Python engineer" in text
@@ -156,3 +156,18 @@ def test_e2e_negative_control_jd_echo_invalidated():
     assert evidence_map_raw["meta"]["invalid_quote_count"] == 1
     assert evidence_map_raw["matches"][1]["matched"] is False
     assert evidence_map_raw["matches"][1]["evidence"] == []
+
+
+def test_no_claimed_matches_skips_resume_normalization(monkeypatch):
+    """With no matched=true entries the resume is never normalized; every entry is marked valid."""
+    from src.scoring import quote_validation
+
+    def fail(_):
+        raise AssertionError("resume normalized")
+
+    monkeypatch.setattr(quote_validation, "_normalized_resume", fail)
+    evidence_map = {"matches": [{"requirement_id": "REQ-1", "matched": False, "evidence": []}]}
+    result = validate_evidence_quotes("Some resume text", evidence_map, min_len=12)
+    assert result["matches"][0]["invalid_quote"] is False
+    assert result["meta"]["matched_count_raw"] == 0
+    assert result["meta"]["matched_count_validated"] == 0
@@ -0,0 +1,100 @@
+"""Tailored PDF test: fast word widths agree with ReportLab and documents still render."""
+
+import io
+
+import pytest
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from gap_analyzer.tailored_pdf import (
+    _clean_text,
+    _split_lines,
+    _text_width,
+    _word_units,
+    generate_tailored_pdf,
+    generate_tailored_pdf_to,
+)
+
+# Joined width is 488.00000000000006 in Helvetica 10 (48800 units * 0.001 * 10): just over a
+# bullet's 488pt width, so "am" must wrap exactly as stringWidth of the joined line says.
+BOUNDARY_LINE = (
+    "AWS on Built Python data AWS APIs APIs scalable for AWS pipelines Kubernetes scalable Python Python am"
+)
+
+
+def _split_lines_by_joined_width(text, font, size, max_width):
+    """Reference wrap: measure every candidate line with stringWidth."""
+    lines, current = [], []
+    for w in text.split():
+        if stringWidth(" ".join(current + [w]), font, size) <= max_width:
+            current.append(w)
+        else:
+            if current:
+                lines.append(" ".join(current))
+            current = [w]
+    if current:
+        lines.append(" ".join(current))
+    return lines or [text]
+
+
+@pytest.mark.parametrize("font", ["Helvetica", "Helvetica-Bold"])
+@pytest.mark.parametrize("size", [10, 11, 12, 26])
+@pytest.mark.parametrize("word", ["Python", "AWS/Lambda", "résumé", "café—bar", "•", "{[()]}", " "])
+def test_word_width_matches_reportlab(word, font, size):
+    assert _text_width(word, font, size) == stringWidth(word, font, size)
+    assert _word_units(word, font) * 0.001 * size == stringWidth(word, font, size)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        BOUNDARY_LINE,
+        BOUNDARY_LINE + " with Go",
+        "Led résumé café—bar • migrations " * 12,
+        "Supercalifragilisticexpialidocious " * 20,
+    ],
+)
+@pytest.mark.parametrize("font, size, max_width", [("Helvetica", 10, 488.0), ("Helvetica-Bold", 11, 504.0), ("Helvetica", 10, 37.5)])
+def test_split_lines_matches_joined_string_width(text, font, size, max_width):
+    assert _split_lines(text, font, size, max_width) == _split_lines_by_joined_width(text, font, size, max_width)
+
+
+def test_split_lines_wraps_at_float_boundary():
+    assert stringWidth(BOUNDARY_LINE, "Helvetica", 10) > 488.0
+    assert _split_lines(BOUNDARY_LINE + " with Go", "Helvetica", 10, 488.0)[1].startswith("am ")
+
+
+@pytest.mark.parametrize(
+    "raw, cleaned",
+    [
+        ("  plain line  ", "plain line"),
+        ("##### Senior Engineer", "Senior Engineer"),
+        ("Built **scalable** APIs", "Built scalable APIs"),
+        ("See [**my site**](https://example.com) and [repo](http://x.io)", "See my site and repo"),
+        ("C# and F#", "C# and F#"),
+    ],
+)
+def test_clean_text_strips_markdown(raw, cleaned):
+    assert _clean_text(raw) == cleaned
+
+
+def test_tailored_pdf_renders_markdown():
+    text = "\n".join([
+        "# Jane Doe",
+        "## Summary",
+        "Senior engineer " * 30,
+        "### Experience",
+        "#### Engineer — Acme",
+        "LANGUAGES",
+        "- Built **scalable** [APIs](http://example.com) with Python and AWS " * 4,
+        "**Skills**: Python, Go",
+        "---",
+    ])
+    pdf = generate_tailored_pdf(text, "Jane Doe")
+    assert pdf.startswith(b"%PDF-")
+    assert pdf.rstrip().endswith(b"%%EOF")
+
+
+def test_tailored_pdf_renders_into_file_object():
+    out = io.BytesIO()
+    generate_tailored_pdf_to(out, "# Jane Doe\n- Python", "Jane Doe")
+    assert out.getvalue().startswith(b"%PDF-")
@@ -0,0 +1,34 @@
+"""Schema validation test: boolean checks agree with validate_*, which raise jsonschema errors."""
+
+import jsonschema
+import pytest
+
+from src.validation import is_valid_requirements, validate_requirements
+
+
+def _requirements_doc() -> dict:
+    return {
+        "role_id": "test_role",
+        "jd_hash": "a" * 64,
+        "requirements_version": "1.0.0",
+        "created_at": "2025-01-01T00:00:00Z",
+        "requirements": [
+            {"id": "REQ-001", "category": "Technical", "name": "Python", "description": "", "must_have": True, "weight": 3},
+        ],
+    }
+
+
+def test_valid_doc():
+    doc = _requirements_doc()
+    assert is_valid_requirements(doc)
+    validate_requirements(doc)
+
+
+def test_invalid_doc_reports_best_match():
+    doc = _requirements_doc()
+    del doc["requirements"][0]["category"]
+    assert not is_valid_requirements(doc)
+    with pytest.raises(jsonschema.ValidationError) as exc:
+        validate_requirements(doc)
+    assert exc.value.message == "'category' is a required property"
+    assert list(exc.value.path) == ["requirements", 0]
@@ -0,0 +1,20 @@
+"""Groq reply cache test: the web app shares llm_cache; GROQ_CACHE_DIR unset disables it."""
+
+from gap_analyzer import web_service
+
+
+def test_repeat_calls_served_from_cache_dir(tmp_path, monkeypatch, calls):
+    monkeypatch.setenv("GROQ_CACHE_DIR", str(tmp_path))
+    first = web_service.analyze_jd("key", "Python role")
+    second = web_service.analyze_jd("key", "Python role")
+    web_service.analyze_jd("key", "Go role")
+    assert first == second
+    assert [c["messages"][1]["content"] for c in calls] == ["Python role", "Go role"]
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+
+def test_cache_disabled_without_dir(monkeypatch, calls):
+    monkeypatch.delenv("GROQ_CACHE_DIR", raising=False)
+    web_service.analyze_jd("key", "Python role")
+    web_service.analyze_jd("key", "Python role")
+    assert len(calls) == 2